@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""Offscreen benchmark suite for MultiBrowser
+
+Runs MultiBrowser under the offscreen QPA platform against a local HTTP fixture
+server with tabs.json files of 1, 10 and 50 tabs and reports:
+
+- cold startup (empty profile) and warm startup (profile and HTTP cache from the cold run)
+- time to first loadFinished and to all started tabs loaded
+- Alt+n switch latency through switch_to_tab and keyPressEvent
+- total RSS of the browser and all its child processes (renderers, GPU, zygote)
+
+Results are written as JSON with sorted keys so runs can be diffed between commits:
+
+    python3 benchmark.py --output before.json
+    git checkout my-branch
+    python3 benchmark.py --output after.json --compare before.json
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TAB_COUNTS = [1, 10, 50]
+LOAD_TIMEOUT_S = 60
+SETTLE_TIME_S = 2  # Let renderers finish their post-load work before measuring RSS
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serve small, cacheable, deterministic pages at /page/<n>"""
+
+    def do_GET(self):
+        page = self.path.strip('/').split('/')[-1] or "0"
+        paragraphs = "".join(f"<p>Paragraph {i} of fixture page {page}.</p>" for i in range(200))
+        body = (
+            f"<!DOCTYPE html><html><head><title>Fixture {page}</title>"
+            f"<style>body {{ font-family: sans-serif; }}</style></head>"
+            f"<body><h1>Fixture page {page}</h1>{paragraphs}"
+            f"<script>document.body.dataset.ready = '1';</script></body></html>"
+        ).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        # Cacheable so the warm run can be served from the HTTP cache
+        self.send_header("Cache-Control", "max-age=3600")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server():
+    """Start the fixture server on a free port, return (server, base_url)"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def write_tabs_file(directory, base_url, count):
+    """Write a tabs.json with count tabs pointing at the fixture server"""
+    path = os.path.join(directory, f"tabs-{count}.json")
+    tabs = [{"title": f"Fixture {i + 1}", "url": f"{base_url}/page/{i + 1}"} for i in range(count)]
+    with open(path, 'w') as f:
+        json.dump(tabs, f, indent=2)
+    return path
+
+
+def descendant_pids(root_pid):
+    """Return root_pid and all its descendants by walking /proc"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", 'r') as f:
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    pids = [root_pid]
+    for pid in pids:
+        pids.extend(children.get(pid, []))
+    return pids
+
+
+def summarize(samples_ms):
+    """Return median, p95 and max of latency samples in milliseconds"""
+    if not samples_ms:
+        return None
+    ordered = sorted(samples_ms)
+    return {
+        'count': len(ordered),
+        'median_ms': round(statistics.median(ordered), 3),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        'max_ms': round(ordered[-1], 3)
+    }
+
+
+def phase_totals(phases):
+    """Sum the durations of startup phases by name (BrowserTab.__init__ runs once per tab)"""
+    totals = {}
+    for phase in phases:
+        totals[phase['name']] = totals.get(phase['name'], 0.0) + phase['end'] - phase['start']
+    return {name: round(duration, 4) for name, duration in totals.items()}
+
+
+def run_worker(args):
+    """Measure one MultiBrowser startup in this process (run with QT_QPA_PLATFORM=offscreen)"""
+    worker_start = time.monotonic()
+
+    # Imported here so the parent process never needs PyQt6
+    import main
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import Qt, QEvent
+    from PyQt6.QtGui import QKeyEvent
+
+    trace_path = os.path.join(args.profile_dir, "startup-trace.json")
+    main.startup_tracer.enable(trace_path)
+
+    app = QApplication(sys.argv)
+    config = main.default_config()
+    config['lazy_tabs'] = args.lazy
+    browser = main.MultiBrowser(config_file=args.tabs_file, config=config, profile_dir=args.profile_dir)
+    browser.show()
+    shown = time.monotonic()
+
+    loaded = set()
+    first_loaded = [None]
+
+    def watch(tab):
+        def on_load_finished(ok, t=tab):
+            if first_loaded[0] is None:
+                first_loaded[0] = time.monotonic()
+            loaded.add(t)
+        tab.loadFinished.connect(on_load_finished)
+
+    for tab in browser.browser_tabs():
+        watch(tab)
+
+    def wait_until(predicate, timeout):
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            app.processEvents()
+            time.sleep(0.005)
+        return predicate()
+
+    started_tabs = browser.browser_tabs()
+    all_loaded = wait_until(lambda: all(tab in loaded for tab in started_tabs), LOAD_TIMEOUT_S)
+    all_loaded_at = time.monotonic()
+    wait_until(lambda: False, SETTLE_TIME_S)
+
+    # Alt+n switching, first through switch_to_tab, then through keyPressEvent
+    targets = list(range(min(10, browser.tab_widget.count())))
+    switch_samples, key_samples = [], []
+    for _ in range(args.switch_rounds):
+        for index in targets:
+            start = time.perf_counter()
+            browser.switch_to_tab(index)
+            app.processEvents()
+            switch_samples.append((time.perf_counter() - start) * 1000)
+        for index in targets:
+            key = Qt.Key.Key_0 if index == 9 else Qt.Key.Key_1 + index
+            event = QKeyEvent(QEvent.Type.KeyPress, key, Qt.KeyboardModifier.AltModifier)
+            start = time.perf_counter()
+            browser.keyPressEvent(event)
+            app.processEvents()
+            key_samples.append((time.perf_counter() - start) * 1000)
+
+    wait_until(lambda: False, SETTLE_TIME_S)
+    pids = descendant_pids(os.getpid())
+    rss = {pid: main.read_process_rss(pid) for pid in pids}
+
+    result = {
+        'tabs': browser.tab_widget.count(),
+        'lazy_tabs': args.lazy,
+        'startup_s': round(shown - worker_start, 4),
+        'first_loadFinished_s': None if first_loaded[0] is None else round(first_loaded[0] - worker_start, 4),
+        'all_started_tabs_loaded': all_loaded,
+        'all_started_tabs_loaded_s': round(all_loaded_at - worker_start, 4),
+        'switch_latency': {
+            'switch_to_tab': summarize(switch_samples),
+            'keyPressEvent': summarize(key_samples)
+        },
+        'rss_mb': {
+            'browser': round(rss[os.getpid()] / (1024 * 1024), 1),
+            'total': round(sum(rss.values()) / (1024 * 1024), 1),
+            'processes': len(pids)
+        },
+        'phases': phase_totals(main.startup_tracer.phases)
+    }
+    with open(args.result, 'w') as f:
+        json.dump(result, f, indent=2, sort_keys=True)
+
+    browser.quitting = True
+    browser.close()
+    app.quit()
+
+
+def run_scenario(tabs_file, profile_dir, lazy, switch_rounds, temp_dir):
+    """Run one worker process and return its result"""
+    result_path = os.path.join(temp_dir, "result.json")
+    env = dict(os.environ)
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    # Keep the worker away from the real ~/.config/multibrowser
+    env['HOME'] = temp_dir
+    command = [
+        sys.executable, os.path.abspath(__file__), '--worker',
+        '--tabs-file', tabs_file, '--profile-dir', profile_dir,
+        '--result', result_path, '--switch-rounds', str(switch_rounds)
+    ]
+    if lazy:
+        command.append('--lazy')
+
+    started = time.monotonic()
+    completed = subprocess.run(command, env=env, cwd=BENCHMARK_DIR, capture_output=True, text=True)
+    wall = time.monotonic() - started
+    # Tearing down QtWebEngine at exit may crash after the result was written - that's fine
+    if not os.path.exists(result_path):
+        print(completed.stderr[-2000:], file=sys.stderr)
+        return {'error': f"worker exited with {completed.returncode}", 'wall_s': round(wall, 3)}
+
+    with open(result_path, 'r') as f:
+        result = json.load(f)
+    os.unlink(result_path)
+    result['wall_s'] = round(wall, 3)
+    return result
+
+
+def git_revision():
+    """Return the current commit if the benchmark runs inside a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARK_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, results):
+    """Print the relative change of the headline numbers against a baseline"""
+    def key(scenario):
+        return (scenario['tabs_in_config'], scenario['run'], scenario['lazy_tabs'])
+
+    previous = {key(scenario): scenario for scenario in baseline.get('scenarios', [])}
+    metrics = [
+        ('startup_s', lambda r: r.get('startup_s')),
+        ('first_loadFinished_s', lambda r: r.get('first_loadFinished_s')),
+        ('switch median ms', lambda r: (r.get('switch_latency', {}).get('switch_to_tab') or {}).get('median_ms')),
+        ('total RSS MB', lambda r: r.get('rss_mb', {}).get('total'))
+    ]
+    for scenario in results['scenarios']:
+        old = previous.get(key(scenario))
+        if old is None:
+            continue
+        print(f"{scenario['tabs_in_config']:>3} tabs {scenario['run']:<4} lazy={scenario['lazy_tabs']}:")
+        for name, getter in metrics:
+            before, after = getter(old['result']), getter(scenario['result'])
+            if before and after is not None:
+                print(f"    {name:<22} {before:>10} -> {after:<10} ({(after - before) / before * 100:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MultiBrowser offscreen benchmark suite')
+    parser.add_argument('--output', default='benchmark-results.json', help='Where to write the JSON results')
+    parser.add_argument('--tabs', type=int, nargs='+', default=DEFAULT_TAB_COUNTS,
+                        help='Tab counts to benchmark (default: 1 10 50)')
+    parser.add_argument('--lazy', action='store_true', help='Benchmark with lazy tabs enabled')
+    parser.add_argument('--switch-rounds', type=int, default=5, help='Rounds of Alt+1..0 switching per run')
+    parser.add_argument('--compare', metavar='BASELINE', help='Print changes against a previous results file')
+    # Internal: one measured startup in a fresh process
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--tabs-file', help=argparse.SUPPRESS)
+    parser.add_argument('--profile-dir', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    server, base_url = start_fixture_server()
+    scenarios = []
+    with tempfile.TemporaryDirectory(prefix="multibrowser-bench-") as temp_dir:
+        for count in args.tabs:
+            tabs_file = write_tabs_file(temp_dir, base_url, count)
+            profile_dir = os.path.join(temp_dir, f"profile-{count}")
+            # Cold: empty profile; warm: same profile with cookies and HTTP cache from the cold run
+            for run in ('cold', 'warm'):
+                print(f"⏱️  {count} tabs, {run} start...")
+                result = run_scenario(tabs_file, profile_dir, args.lazy, args.switch_rounds, temp_dir)
+                scenarios.append({'tabs_in_config': count, 'run': run, 'lazy_tabs': args.lazy, 'result': result})
+    server.shutdown()
+
+    results = {
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'scenarios': scenarios
+    }
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"✓ Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            compare(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
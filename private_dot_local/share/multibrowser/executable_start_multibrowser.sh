@@ -15,6 +15,13 @@ else
   exit 1
 fi
 
+# Hand the arguments to an already running instance - no PyQt6 import needed
+if python3 "$SCRIPT_DIR/single_instance.py" --window-class "tk-scratchpad" "$@"; then
+  echo "Handed over to running MultiBrowser instance"
+  deactivate
+  exit 0
+fi
+
 # Check if required packages are installed
 if ! python3 -c "import PyQt6.QtWebEngineWidgets" 2>/dev/null; then
   echo "Required packages not found. Installing..."
@@ -22,7 +29,7 @@ if ! python3 -c "import PyQt6.QtWebEngineWidgets" 2>/dev/null; then
 fi
 
 # Launch the application with default window class for Hyprland
-python3 "$SCRIPT_DIR/main.py" --window-class "tk-scratchpad" "$@"
+python3 "$SCRIPT_DIR/main.py" --window-class "tk-scratchpad" --single-instance "$@"
 
 deactivate
 
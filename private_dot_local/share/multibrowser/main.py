@@ -4,19 +4,284 @@ import sys
 import json
 import argparse
 import os
-import threading
 import time
-from PyQt6.QtWidgets import QApplication, QMainWindow, QTabWidget, QVBoxLayout, QWidget, QTabBar, QLabel, QHBoxLayout, QToolButton, QMenu
+import copy
+import fcntl
+import atexit
+import tempfile
+import threading
+import re
+import zlib
+import struct
+import marshal
+import hashlib
+import functools
+import logging
+from collections import Counter, OrderedDict, deque
+from string import Template
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+# Taken before the PyQt6 imports so the startup trace includes them
+PROCESS_START_MONOTONIC = time.monotonic()
+
+from PyQt6.QtWidgets import QApplication, QMainWindow, QTabWidget, QVBoxLayout, QWidget, QTabBar, QLabel, QHBoxLayout, QToolButton, QMenu, QDialog, QTableWidget, QTableWidgetItem, QHeaderView, QPushButton, QPlainTextEdit, QStackedWidget, QGridLayout, QScrollArea, QLineEdit, QListWidget, QListWidgetItem
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile, QWebEnginePage
-from PyQt6.QtCore import Qt, QStandardPaths, QFile, QTextStream, QIODevice, QSize
-from PyQt6.QtGui import QFontDatabase, QFont, QColor, QShortcut, QKeySequence, QAction
+from PyQt6.QtWebEngineCore import QWebEngineSettings, QWebEngineProfile, QWebEnginePage, QWebEngineUrlRequestInterceptor, QWebEngineUrlRequestInfo, QWebEngineDownloadRequest
+from PyQt6.QtCore import Qt, QStandardPaths, QFile, QTextStream, QIODevice, QSize, QObject, QTimer, QFileSystemWatcher, pyqtSignal, QUrl, QByteArray, QDataStream
+from PyQt6.QtGui import QFont, QFontDatabase, QColor, QShortcut, QKeySequence, QAction, QActionGroup, QIcon
+from PyQt6.QtNetwork import QLocalServer
+from PyQt6 import sip
+from single_instance import instance_socket_path, forward_to_running_instance
 
 # Configuration constants
 DEFAULT_CONFIG_DIR = os.path.expanduser("~/.config/multibrowser")
 DEFAULT_CONFIG_FILE = os.path.join(DEFAULT_CONFIG_DIR, "multibrowser.json")
 DEFAULT_THEME = "tokyo-night"  # Default to tokyo-night theme
+THEMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "themes")
+TAB_FONT_FAMILY = "FiraCode Nerd Font"
+FALLBACK_FONT_FAMILY = "Monospace"
+TAB_FONT_SIZE = 24
 DEFAULT_DARK_MODE = True  # Default to dark mode
+CONFIG_WRITE_DELAY = 0.5  # Seconds to coalesce config writes (e.g. holding Ctrl++)
+DEFAULT_LAZY_TABS = False  # Create every tab up front unless lazy mode is enabled
+DEFAULT_SINGLE_INSTANCE = False  # Start a new process for every launch unless enabled
+DEFAULT_HIBERNATION = {
+    'enabled': False,        # Opt-in: nothing is discarded unless enabled
+    'max_live_tabs': 0,      # 0 = no tab-count budget
+    'max_rss_mb': 0,         # 0 = no RSS budget
+    'psi_threshold': 10.0,   # "some avg10" percentage from /proc/pressure/memory, 0 = ignore
+    'check_interval_s': 30
+}
+DEFAULT_LIFECYCLE = {
+    'enabled': False,        # Opt-in: chat and music tabs keep running unless enabled
+    'freeze_after_s': 300    # Freeze background tabs after this many seconds out of view
+}
+PSI_MEMORY_FILE = "/proc/pressure/memory"
+TELEMETRY_INTERVAL_S = 10  # Seconds between /proc samples of the renderer processes
+DEFAULT_CACHE = {
+    'mode': 'disk',          # disk, memory or none
+    'max_size_mb': 100,      # 0 = let Chromium pick the size
+    'path': None             # Defaults to <profile>/cache, relative paths are resolved against the profile
+}
+HTTP_CACHE_TYPES = {
+    'disk': QWebEngineProfile.HttpCacheType.DiskHttpCache,
+    'memory': QWebEngineProfile.HttpCacheType.MemoryHttpCache,
+    'none': QWebEngineProfile.HttpCacheType.NoCache
+}
+DEFAULT_BLOCKING = {
+    'enabled': False,
+    'lists': [],             # hosts files or ABP lists; only "||domain^" rules are used from the latter
+    'allow': []              # Domains (and their subdomains) that are never blocked
+}
+BLOCK_INDEX_VERSION = 1
+DEFAULT_LOGGING = {
+    'level': 'WARNING',      # Console output level, quiet by default
+    'ring_buffer': 1000,     # Records kept in memory for the Log viewer, 0 = disabled
+    'ring_level': 'INFO',    # Lowest level kept in the ring buffer
+    'repeat_limit': 5,       # Identical messages from one call site allowed per window
+    'repeat_window_s': 60
+}
+LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
+DEFAULT_PREWARM = {
+    'enabled': False,
+    'top_k': 3,              # Most likely next tabs kept loaded and active
+    'check_interval_s': 60,
+    'half_life_days': 7      # Older switches count half as much after this many days
+}
+DEFAULT_RELOAD = {
+    'max_concurrent': 2,     # Background tabs reloading at the same time
+    'timeout_s': 15,         # Start the next reload if a tab hasn't finished loading by then
+    'stale_background': False  # Only mark background tabs stale and reload them when next selected
+}
+DEFAULT_POPUPS = {
+    'mode': 'auto',          # auto (dialogs as windows, "new tab" links as tabs), window or tab
+    'max_popups': 4,         # The oldest popup is closed when a new one would exceed this
+    'pool_size': 1           # Pre-created views for fast popup opening
+}
+DEFAULT_THUMBNAILS = {
+    'budget_mb': 32,         # Memory for tab overview thumbnails, least recently captured dropped first (0 disables)
+    'width': 320             # Thumbnails are downscaled to this width
+}
+DEFAULT_SNAPSHOTS = {
+    'enabled': False,
+    'max_size_mb': 100,      # Oldest snapshots are deleted when the store grows beyond this
+    'save_interval_s': 300,  # Loaded, active tabs are snapshotted this often
+    'max_age_days': 7        # Older snapshots are not shown at startup
+}
+# Web settings for every view, set once on the profile (views inherit them)
+PROFILE_WEB_SETTINGS = {
+    'JavascriptEnabled': True,
+    'LocalStorageEnabled': True,
+    'LocalContentCanAccessRemoteUrls': True,
+    'XSSAuditingEnabled': True,
+    'SpatialNavigationEnabled': True,
+    'LocalContentCanAccessFileUrls': True,
+    'HyperlinkAuditingEnabled': True,
+    'ScrollAnimatorEnabled': True,
+    'ErrorPageEnabled': True,
+    'PluginsEnabled': True,
+    'FullScreenSupportEnabled': True,
+    'ScreenCaptureEnabled': True,
+    'WebGLEnabled': True,
+    'Accelerated2dCanvasEnabled': True,
+    'AutoLoadImages': True,
+    'JavascriptCanOpenWindows': True,
+    'JavascriptCanAccessClipboard': True,
+    'AllowRunningInsecureContent': False,
+    'AllowGeolocationOnInsecureOrigins': False,
+    'PrintElementBackgrounds': True,
+    'PdfViewerEnabled': True
+}
+# Per-tab performance tiers: differences from the profile-wide settings
+PERFORMANCE_TIERS = {
+    'full': {},
+    'standard': {
+        'PluginsEnabled': False,
+        'ScrollAnimatorEnabled': False,
+        'ScreenCaptureEnabled': False
+    },
+    'lite': {
+        'PluginsEnabled': False,
+        'ScrollAnimatorEnabled': False,
+        'ScreenCaptureEnabled': False,
+        'WebGLEnabled': False,
+        'Accelerated2dCanvasEnabled': False,
+        'PdfViewerEnabled': False,
+        'SpatialNavigationEnabled': False
+    }
+}
+DEFAULT_TIER = 'full'
+DEFAULT_TAB_SET = "default"  # Name of the implicit set when multibrowser.json defines no "tab_sets"
+DEFAULT_RESTORE_SESSION = False  # Start every tab from its tabs.json URL unless enabled
+SESSION_SAVE_INTERVAL_S = 60  # Seconds between periodic session saves
+
+log = logging.getLogger("multibrowser")
+
+class RingBufferHandler(logging.Handler):
+    """Keep the most recent formatted log records in memory for the Log viewer"""
+    
+    def __init__(self, capacity=DEFAULT_LOGGING['ring_buffer']):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+        self.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(message)s", "%H:%M:%S"))
+    
+    def resize(self, capacity):
+        """Change the capacity, keeping the newest records"""
+        self.records = deque(self.records, maxlen=capacity)
+    
+    def emit(self, record):
+        self.records.append(self.format(record))
+    
+    def lines(self):
+        """Return the buffered records, oldest first"""
+        return list(self.records)
+
+class RepeatSuppressionFilter(logging.Filter):
+    """Let through at most `limit` identical messages per call site and window, then count the rest"""
+    
+    MAX_SITES = 1024         # Forget one-off and expired messages beyond this many
+    
+    def __init__(self, limit=DEFAULT_LOGGING['repeat_limit'], window_s=DEFAULT_LOGGING['repeat_window_s']):
+        super().__init__()
+        self.limit = limit
+        self.window_s = window_s
+        self.lock = threading.Lock()
+        self.sites = {}    # (pathname, lineno, message) -> [window start, count, suppressed]
+    
+    def filter(self, record):
+        now = time.monotonic()
+        # The formatted message is part of the key, so e.g. discarding five different tabs
+        # doesn't mute the sixth
+        key = (record.pathname, record.lineno, record.getMessage())
+        with self.lock:
+            if len(self.sites) > self.MAX_SITES:
+                # Messages with a URL in them are mostly unique; keep the ones that repeat
+                self.sites = {site_key: site for site_key, site in self.sites.items()
+                              if site[2] or (site[1] > 1 and now - site[0] < self.window_s)}
+            site = self.sites.get(key)
+            if site is None or now - site[0] >= self.window_s:
+                suppressed = site[2] if site else 0
+                self.sites[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} ({suppressed} similar messages suppressed)"
+                return True
+            site[1] += 1
+            if site[1] <= self.limit:
+                return True
+            site[2] += 1
+            return False
+
+log_buffer = RingBufferHandler()
+repeat_filter = RepeatSuppressionFilter()
+
+def setup_logging(settings=None, level=None):
+    """Configure console output, the ring buffer and repeat suppression
+
+    level (from --log-level) overrides settings['level'].
+    """
+    settings = {**DEFAULT_LOGGING, **(settings or {})}
+    console_level = logging.getLevelName(str(level or settings['level']).upper())
+    if not isinstance(console_level, int):
+        console_level = logging.WARNING
+    
+    for handler in list(log.handlers):
+        log.removeHandler(handler)
+    log.propagate = False
+    
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    console.setLevel(console_level)
+    log.addHandler(console)
+    
+    # The logger level is the lowest level any handler wants, so disabled
+    # debug calls return before formatting anything
+    logger_level = console_level
+    if settings['ring_buffer']:
+        ring_level = logging.getLevelName(str(settings['ring_level']).upper())
+        if not isinstance(ring_level, int):
+            ring_level = logging.INFO
+        log_buffer.resize(int(settings['ring_buffer']))
+        log_buffer.setLevel(ring_level)
+        log.addHandler(log_buffer)
+        logger_level = min(logger_level, ring_level)
+    log.setLevel(logger_level)
+    
+    repeat_filter.limit = settings['repeat_limit']
+    repeat_filter.window_s = settings['repeat_window_s']
+    if repeat_filter not in log.filters:
+        log.addFilter(repeat_filter)
+
+def web_attribute_settings(names):
+    """Convert {attribute name: bool} into a tuple of (WebAttribute, bool), skipping unknown names"""
+    result = []
+    for name, enabled in names.items():
+        attribute = getattr(QWebEngineSettings.WebAttribute, name, None)
+        if attribute is None:
+            log.warning("⚠️  Unknown web setting '%s'", name)
+            continue
+        result.append((attribute, bool(enabled)))
+    return tuple(result)
+
+# Precomputed once so creating a tab only loops over a few (attribute, value) pairs
+TIER_SETTINGS = {tier: web_attribute_settings(names) for tier, names in PERFORMANCE_TIERS.items()}
+
+@functools.lru_cache(maxsize=None)
+def resolve_tier_settings(tier, overrides=()):
+    """Return the settings bundle for a tier plus explicit (name, bool) overrides from tabs.json"""
+    if tier not in TIER_SETTINGS:
+        log.warning("⚠️  Unknown performance tier '%s', using %s", tier, DEFAULT_TIER)
+        tier = DEFAULT_TIER
+    if not overrides:
+        return TIER_SETTINGS[tier]
+    merged = {**PERFORMANCE_TIERS[tier], **dict(overrides)}
+    return web_attribute_settings(merged)
+
+def apply_profile_web_settings(profile):
+    """Set the profile-wide web settings every view inherits"""
+    settings = profile.settings()
+    for attribute, enabled in web_attribute_settings(PROFILE_WEB_SETTINGS):
+        settings.setAttribute(attribute, enabled)
 
 class CustomTabBar(QTabBar):
     """Custom tab bar with rich text formatting for keyboard shortcuts"""
@@ -28,47 +293,379 @@ class CustomTabBar(QTabBar):
         self.font = QFont("Monospace", 24)     # Default font
 
 
+def list_themes(themes_dir=THEMES_DIR):
+    """Return the names of the themes in the themes directory"""
+    try:
+        return sorted(name[:-len(".css")] for name in os.listdir(themes_dir) if name.endswith(".css"))
+    except OSError:
+        return []
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_font_family(requested=TAB_FONT_FAMILY):
+    """Resolve a font family once through Qt's font database, falling back to monospace (needs a QApplication)"""
+    # Qt has already loaded the fontconfig font list in-process, so this doesn't spawn fc-list
+    if QFontDatabase.hasFamily(requested):
+        log.debug("✓ Font resolved through the font database: %s", requested)
+        return requested
+    log.warning("⚠️  %s not found, using %s", requested, FALLBACK_FONT_FAMILY)
+    return FALLBACK_FONT_FAMILY
+
+
+# Chromium process model and engine presets for the "engine" section of multibrowser.json
+ENGINE_PROCESS_MODELS = ['process-per-site-instance', 'process-per-site', 'single-process']
+ENGINE_PRESETS = {
+    'default': {},
+    'low-memory': {
+        'process_model': 'process-per-site',
+        'renderer_process_limit': 2,
+        'js_heap_mb': 512,
+        'disable_features': ['BackForwardCache'],
+        'extra_flags': ['--enable-low-end-device-mode']
+    },
+    'throughput': {
+        'process_model': 'process-per-site-instance',
+        'renderer_process_limit': 0,
+        'extra_flags': ['--enable-gpu-rasterization', '--enable-zero-copy', '--ignore-gpu-blocklist']
+    }
+}
+# Expected type of every engine setting
+ENGINE_SETTING_TYPES = {
+    'preset': str,
+    'process_model': str,
+    'renderer_process_limit': int,
+    'js_heap_mb': int,
+    'disable_gpu': bool,
+    'share_opengl_contexts': bool,
+    'enable_features': list,
+    'disable_features': list,
+    'extra_flags': list
+}
+
+
+def resolve_engine_config(config, args=None):
+    """Merge preset, multibrowser.json "engine" section and CLI overrides; return (settings, warnings)"""
+    warnings = []
+    section = dict(config.get('engine', {}))
+    
+    # CLI overrides win over the config file
+    if args is not None:
+        if args.engine_preset:
+            section['preset'] = args.engine_preset
+        if args.renderer_process_limit is not None:
+            section['renderer_process_limit'] = args.renderer_process_limit
+        if args.process_model:
+            section['process_model'] = args.process_model
+    
+    for key, value in list(section.items()):
+        expected = ENGINE_SETTING_TYPES.get(key)
+        if expected is None:
+            warnings.append(f"unknown engine setting '{key}' ignored")
+            del section[key]
+        elif not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+            warnings.append(f"engine setting '{key}' must be {expected.__name__}, ignored")
+            del section[key]
+        elif expected is list:
+            # Features and flags are joined into command-line arguments, so only strings are usable
+            strings = [item for item in value if isinstance(item, str)]
+            if len(strings) != len(value):
+                warnings.append(f"engine setting '{key}' must only contain strings, ignored the other entries")
+                section[key] = strings
+    
+    preset = section.pop('preset', 'default')
+    if preset not in ENGINE_PRESETS:
+        warnings.append(f"unknown engine preset '{preset}', using 'default'")
+        preset = 'default'
+    
+    settings = {'preset': preset, 'share_opengl_contexts': True, **ENGINE_PRESETS[preset], **section}
+    
+    if settings.get('process_model', ENGINE_PROCESS_MODELS[0]) not in ENGINE_PROCESS_MODELS:
+        warnings.append(f"unknown process_model '{settings['process_model']}', using Chromium's default")
+        settings.pop('process_model')
+    for key in ('renderer_process_limit', 'js_heap_mb'):
+        if settings.get(key, 0) < 0:
+            warnings.append(f"engine setting '{key}' must not be negative, ignored")
+            settings.pop(key)
+    
+    return settings, warnings
+
+
+def build_chromium_flags(settings):
+    """Turn resolved engine settings into QTWEBENGINE_CHROMIUM_FLAGS arguments"""
+    flags = []
+    process_model = settings.get('process_model')
+    if process_model == 'process-per-site':
+        flags.append('--process-per-site')
+    elif process_model == 'single-process':
+        flags.append('--single-process')
+    if settings.get('renderer_process_limit'):
+        flags.append(f"--renderer-process-limit={settings['renderer_process_limit']}")
+    if settings.get('js_heap_mb'):
+        flags.append(f"--js-flags=--max-old-space-size={settings['js_heap_mb']}")
+    if settings.get('disable_gpu'):
+        flags.append('--disable-gpu')
+    if settings.get('enable_features'):
+        flags.append(f"--enable-features={','.join(settings['enable_features'])}")
+    if settings.get('disable_features'):
+        flags.append(f"--disable-features={','.join(settings['disable_features'])}")
+    flags.extend(settings.get('extra_flags', []))
+    
+    # Flags already in the environment come last so they can override ours
+    flags.extend(os.environ.get('QTWEBENGINE_CHROMIUM_FLAGS', '').split())
+    return flags
+
+
+def apply_engine_config(settings):
+    """Set Chromium flags and application attributes - must run before QApplication is created"""
+    flags = build_chromium_flags(settings)
+    if flags:
+        os.environ['QTWEBENGINE_CHROMIUM_FLAGS'] = ' '.join(flags)
+    if settings.get('share_opengl_contexts'):
+        QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+    log.info("⚙️  Engine preset '%s' with flags: %s", settings['preset'], ' '.join(flags) or '(none)')
+    return flags
+
+
+# Marks a key removed in a config patch
+_DELETED = object()
+
+
+def config_diff(base, current, path=()):
+    """Return the (path, value) patches that turn base into current, recursing into dicts"""
+    patches = []
+    for key in set(base) | set(current):
+        key_path = path + (key,)
+        if key not in current:
+            patches.append((key_path, _DELETED))
+        elif key not in base:
+            patches.append((key_path, copy.deepcopy(current[key])))
+        elif isinstance(base[key], dict) and isinstance(current[key], dict):
+            patches.extend(config_diff(base[key], current[key], key_path))
+        elif base[key] != current[key]:
+            patches.append((key_path, copy.deepcopy(current[key])))
+    return patches
+
+
+def apply_config_patches(target, patches):
+    """Apply patches from config_diff to target in place"""
+    for path, value in patches:
+        node = target
+        for key in path[:-1]:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        if value is _DELETED:
+            node.pop(path[-1], None)
+        else:
+            node[path[-1]] = value
+    return target
+
+
+class ConfigStore:
+    """Debounced, atomic and multi-process safe storage behind load_config/save_config
+    
+    Writes are coalesced on a worker thread and only the keys this process changed
+    are merged into the file on disk, under an flock shared by all MultiBrowser
+    processes, so a work and a personal instance don't overwrite each other.
+    """
+    
+    def __init__(self, path, write_delay=CONFIG_WRITE_DELAY):
+        self.path = path
+        self.lock_path = path + ".lock"
+        self.write_delay = write_delay
+        
+        self.data = {}       # Live config dict shared with the application
+        self.base = {}       # What the file contained when we last read or wrote it
+        self.mtime = None    # mtime of the file after our last read or write
+        self.listeners = []  # Called on the GUI thread after another process changed the file
+        
+        self.condition = threading.Condition()
+        self.write_lock = threading.Lock()
+        self.snapshot = None
+        self.deadline = None
+        self.worker = None
+        self.writes = 0
+    
+    @contextmanager
+    def file_lock(self):
+        """Hold an exclusive lock shared by every MultiBrowser process"""
+        with open(self.lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def read_disk(self):
+        """Return (config, mtime) from disk, or (None, None) if the file doesn't exist"""
+        try:
+            with open(self.path, 'r') as f:
+                config = json.load(f)
+                return config, os.fstat(f.fileno()).st_mtime
+        except FileNotFoundError:
+            return None, None
+    
+    def load(self):
+        """Load the file into the live config dict, return None if it doesn't exist"""
+        with self.file_lock():
+            config, mtime = self.read_disk()
+        if config is None:
+            return None
+        with self.condition:
+            self.base = copy.deepcopy(config)
+            self.mtime = mtime
+        self.data = config
+        return self.data
+    
+    def adopt(self, config):
+        """Use config as the live dict, e.g. defaults when the file is missing or broken"""
+        self.data = config
+        return self.data
+    
+    def save(self, config):
+        """Schedule a write; calls within write_delay are coalesced into one write"""
+        self.data = config
+        with self.condition:
+            # Snapshot on the calling (GUI) thread so the worker never sees a dict mid-update
+            self.snapshot = copy.deepcopy(config)
+            self.deadline = time.monotonic() + self.write_delay
+            if self.worker is None:
+                self.worker = threading.Thread(target=self.run_worker, name="config-writer", daemon=True)
+                self.worker.start()
+            self.condition.notify()
+    
+    def run_worker(self):
+        """Wait for the debounce deadline, then write"""
+        while True:
+            with self.condition:
+                while self.snapshot is None:
+                    self.condition.wait()
+                remaining = self.deadline - time.monotonic()
+                if remaining > 0:
+                    # More changes may arrive and push the deadline back
+                    self.condition.wait(remaining)
+                    continue
+            self.flush()
+    
+    def flush(self):
+        """Write pending changes now (called by the worker and on exit)"""
+        with self.write_lock:
+            with self.condition:
+                snapshot = self.snapshot
+                self.snapshot = None
+                base = self.base
+            if snapshot is None:
+                return
+            
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with self.file_lock():
+                    # Merge only our own changes into whatever is on disk now
+                    try:
+                        disk, _ = self.read_disk()
+                        merged = apply_config_patches(disk or {}, config_diff(base, snapshot))
+                        foreign = disk is not None and disk != base
+                    except json.JSONDecodeError as e:
+                        # A corrupt file can't be merged into, and would fail every later write
+                        log.warning("⚠️  %s is corrupt (%s), replacing it with this instance's config", self.path, e)
+                        merged = copy.deepcopy(snapshot)
+                        foreign = False
+                    self.write_atomic(merged)
+                    mtime = os.stat(self.path).st_mtime
+                with self.condition:
+                    # The base is what the live dict looked like when written; keys another
+                    # process changed are not in it yet, so leave the mtime for reload() to notice
+                    self.base = snapshot
+                    self.mtime = None if foreign else mtime
+                self.writes += 1
+                log.debug("✓ Saved config to %s", self.path)
+            except Exception as e:
+                log.warning("⚠️  Error saving config: %s", e)
+    
+    def write_atomic(self, config):
+        """Write via a temporary file and rename so readers never see a partial file"""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix=".multibrowser.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(config, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def reload(self):
+        """Pick up changes written by another process, keeping our unsaved changes (GUI thread)"""
+        try:
+            if os.stat(self.path).st_mtime == self.mtime:
+                return False
+            with self.file_lock():
+                disk, mtime = self.read_disk()
+        except (OSError, json.JSONDecodeError):
+            return False
+        if disk is None:
+            return False
+        
+        with self.condition:
+            local_changes = config_diff(self.base, self.data)
+            self.base = copy.deepcopy(disk)
+            self.mtime = mtime
+            
+            # Update the live dict in place - the application holds a reference to it
+            merged = apply_config_patches(disk, local_changes)
+            self.data.clear()
+            self.data.update(merged)
+            
+            # A pending write was diffed against the old base; against the new one it
+            # would reset the other instance's keys, so snapshot the merged config again
+            if self.snapshot is not None:
+                self.snapshot = copy.deepcopy(self.data)
+        log.info("🔄 Reloaded config changed by another instance: %s", self.path)
+        
+        for listener in self.listeners:
+            listener()
+        return True
+
+
+# Shared store behind load_config/save_config
+config_store = ConfigStore(DEFAULT_CONFIG_FILE)
+atexit.register(config_store.flush)
+
+
+def default_config():
+    """Return the default configuration"""
+    return {
+        'theme': DEFAULT_THEME,
+        'dark_mode': DEFAULT_DARK_MODE,
+        'zoom_factors': {}
+    }
+
+
 def load_config():
     """Load configuration from persistent config file"""
     try:
         # Create config directory if it doesn't exist
         os.makedirs(DEFAULT_CONFIG_DIR, exist_ok=True)
         
-        if os.path.exists(DEFAULT_CONFIG_FILE):
-            with open(DEFAULT_CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                print(f"✓ Loaded config from {DEFAULT_CONFIG_FILE}")
-                return config
+        config = config_store.load()
+        if config is not None:
+            log.info("✓ Loaded config from %s", DEFAULT_CONFIG_FILE)
+            return config
         else:
             # Return default config if file doesn't exist
-            default_config = {
-                'theme': DEFAULT_THEME,
-                'dark_mode': DEFAULT_DARK_MODE,
-                'zoom_factors': {}
-            }
-            save_config(default_config)
-            return default_config
+            config = config_store.adopt(default_config())
+            save_config(config)
+            return config
     except Exception as e:
-        print(f"⚠️  Error loading config: {e}")
+        log.warning("⚠️  Error loading config: %s", e)
         # Return default config on error
-        return {
-            'theme': DEFAULT_THEME,
-            'dark_mode': DEFAULT_DARK_MODE,
-            'zoom_factors': {}
-        }
+        return config_store.adopt(default_config())
 
 
 def save_config(config):
-    """Save configuration to persistent config file"""
-    try:
-        # Create config directory if it doesn't exist
-        os.makedirs(DEFAULT_CONFIG_DIR, exist_ok=True)
-        
-        with open(DEFAULT_CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
-        print(f"✓ Saved config to {DEFAULT_CONFIG_FILE}")
-    except Exception as e:
-        print(f"⚠️  Error saving config: {e}")
+    """Schedule saving configuration to persistent config file (debounced, atomic)"""
+    config_store.save(config)
 
 
 def update_config_from_args(args, config):
@@ -78,17 +675,17 @@ def update_config_from_args(args, config):
     if args.theme and args.theme != config.get('theme'):
         config['theme'] = args.theme
         updated = True
-        print(f"📝 Updated default theme to: {args.theme}")
+        log.info("📝 Updated default theme to: %s", args.theme)
     
     # Handle dark/light mode flags
     if args.light_mode and config.get('dark_mode', DEFAULT_DARK_MODE) != False:
         config['dark_mode'] = False
         updated = True
-        print(f"📝 Updated default dark mode to: False (light mode)")
+        log.info("📝 Updated default dark mode to: False (light mode)")
     elif args.dark_mode and config.get('dark_mode', DEFAULT_DARK_MODE) != True:
         config['dark_mode'] = True
         updated = True
-        print(f"📝 Updated default dark mode to: True (dark mode)")
+        log.info("📝 Updated default dark mode to: True (dark mode)")
     
     if updated:
         save_config(config)
@@ -109,110 +706,2395 @@ def update_config_from_args(args, config):
         # For now, use the default painting but we'll enhance this
         super().paintEvent(event)
 
+class StartupTracer:
+    """Record monotonic timestamps of startup phases and per-tab load events"""
+    
+    # Evaluated in the page: epoch milliseconds of the first (contentful) paint, or null
+    FIRST_PAINT_SCRIPT = """
+        (function() {
+            var entry = performance.getEntriesByName('first-contentful-paint')[0]
+                     || performance.getEntriesByName('first-paint')[0];
+            return entry ? performance.timeOrigin + entry.startTime : null;
+        })()
+    """
+    
+    def __init__(self, origin=None):
+        self.enabled = False
+        self.path = None
+        self.trace_format = 'json'
+        self.origin = origin if origin is not None else time.monotonic()
+        self.phases = []
+        self.events = []
+        self.first_load_finished = None
+    
+    def enable(self, path, trace_format='json'):
+        """Start recording; the trace is written to path by write()"""
+        self.enabled = True
+        self.path = path
+        self.trace_format = trace_format
+        # Everything between process start and now is module import, mostly PyQt6
+        self.phases.append({'name': 'import', 'start': 0.0, 'end': self.now(), 'args': {}})
+    
+    def now(self):
+        """Return seconds since process start"""
+        return time.monotonic() - self.origin
+    
+    @contextmanager
+    def phase(self, name, **args):
+        """Record the duration of a startup phase"""
+        if not self.enabled:
+            yield
+            return
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.phases.append({'name': name, 'start': start, 'end': self.now(), 'args': args})
+    
+    def event(self, name, timestamp=None, **args):
+        """Record an instant event"""
+        if not self.enabled:
+            return
+        self.events.append({'name': name, 'ts': self.now() if timestamp is None else timestamp, 'args': args})
+    
+    def watch_tab(self, tab, index):
+        """Record the first loadStarted, loadFinished and visual paint of a tab"""
+        if not self.enabled:
+            return
+        seen = set()
+        
+        def record_once(name, **args):
+            if name in seen:
+                return False
+            seen.add(name)
+            self.event(name, tab=index, url=tab.url().toString(), **args)
+            return True
+        
+        def on_load_finished(ok):
+            if not record_once('loadFinished', ok=ok):
+                return
+            if self.first_load_finished is None:
+                self.first_load_finished = self.now()
+                self.event('first_loadFinished', tab=index)
+            tab.page().runJavaScript(self.FIRST_PAINT_SCRIPT, lambda result: self.record_first_paint(tab, index, result))
+        
+        tab.loadStarted.connect(lambda: record_once('loadStarted'))
+        tab.loadFinished.connect(on_load_finished)
+    
+    def record_first_paint(self, tab, index, epoch_ms):
+        """Convert the page's paint timing (wall clock) to the trace clock"""
+        if epoch_ms is None:
+            return
+        age = time.time() - epoch_ms / 1000.0
+        self.event('firstPaint', timestamp=self.now() - age, tab=index, url=tab.url().toString())
+    
+    def to_json(self):
+        """Return the trace as a plain JSON-serializable dict"""
+        return {
+            'clock': 'monotonic seconds since process start',
+            'phases': [dict(phase, duration=phase['end'] - phase['start']) for phase in self.phases],
+            'events': sorted(self.events, key=lambda event: event['ts']),
+            'first_loadFinished': self.first_load_finished
+        }
+    
+    def to_chrome_trace(self):
+        """Return the trace in Chrome trace-event format (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        trace_events = []
+        for phase in self.phases:
+            trace_events.append({
+                'name': phase['name'], 'ph': 'X', 'pid': pid, 'tid': 0,
+                'ts': phase['start'] * 1e6, 'dur': (phase['end'] - phase['start']) * 1e6,
+                'args': phase['args']
+            })
+        for event in self.events:
+            # One track per tab keeps the load events readable
+            tid = event['args'].get('tab', -1) + 1
+            trace_events.append({
+                'name': event['name'], 'ph': 'i', 's': 't', 'pid': pid, 'tid': tid,
+                'ts': event['ts'] * 1e6, 'args': event['args']
+            })
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+    
+    def write(self):
+        """Write the trace file (safe to call more than once, the last call wins)"""
+        if not self.enabled:
+            return
+        data = self.to_chrome_trace() if self.trace_format == 'chrome' else self.to_json()
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(data, f, indent=2)
+            log.info("⏱️  Startup trace written to %s", self.path)
+        except OSError as e:
+            log.warning("⚠️  Error writing startup trace: %s", e)
+
+
+# Shared tracer, disabled unless --trace-startup is given
+startup_tracer = StartupTracer(PROCESS_START_MONOTONIC)
+
+
+def normalize_origin(url):
+    """Return scheme://host[:port] in lower case with default ports dropped, or None"""
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    if not parts.scheme or not parts.hostname:
+        return None
+    
+    scheme = parts.scheme.lower()
+    origin = f"{scheme}://{parts.hostname.lower()}"
+    if port and port != {'http': 80, 'https': 443}.get(scheme):
+        origin += f":{port}"
+    return origin
+
+
+class ZoomIndex:
+    """In-memory zoom factors keyed by normalized origin, with optional path-prefix rules"""
+    
+    def __init__(self, config):
+        self.config = config
+        self.reload()
+    
+    def reload(self):
+        """Rebuild the index from config['zoom_factors'] and config['zoom_path_rules']"""
+        self.origins = {}
+        for key, zoom in self.config.get('zoom_factors', {}).items():
+            # Older configs keyed zoom by the exact URL - fold those into their origin
+            origin = normalize_origin(key)
+            if origin:
+                self.origins[origin] = zoom
+        self.config['zoom_factors'] = dict(self.origins)
+        
+        # Path rules like "https://example.com/app": longest prefix wins
+        self.rules = []
+        for prefix, zoom in self.config.get('zoom_path_rules', {}).items():
+            origin = normalize_origin(prefix)
+            if origin:
+                self.rules.append((origin, urlsplit(prefix).path or '/', prefix, zoom))
+        self.rules.sort(key=lambda rule: len(rule[1]), reverse=True)
+    
+    def lookup(self, url):
+        """Return (key, zoom) for a URL; zoom is None when nothing is stored"""
+        origin = normalize_origin(url)
+        if origin is None:
+            return None, None
+        path = urlsplit(url).path or '/'
+        for rule_origin, rule_path, prefix, zoom in self.rules:
+            if rule_origin == origin and (path == rule_path or path.startswith(rule_path.rstrip('/') + '/')):
+                return prefix, zoom
+        return origin, self.origins.get(origin)
+    
+    def set(self, url, zoom):
+        """Store the zoom for a URL under its matching path rule or its origin"""
+        key, _ = self.lookup(url)
+        if key is None:
+            return None
+        
+        zoom = round(zoom, 2)
+        if key in self.config.get('zoom_path_rules', {}):
+            self.config['zoom_path_rules'][key] = zoom
+        elif abs(zoom - 1.0) < 0.001:
+            # Default zoom needs no entry
+            self.config['zoom_factors'].pop(key, None)
+        else:
+            self.config['zoom_factors'][key] = zoom
+        self.reload()
+        return key
+
+
+def read_memory_pressure():
+    """Return the 'some avg10' memory pressure percentage, or None if PSI is unavailable"""
+    try:
+        with open(PSI_MEMORY_FILE, 'r') as f:
+            for line in f:
+                if line.startswith('some'):
+                    fields = dict(item.split('=', 1) for item in line.split()[1:])
+                    return float(fields['avg10'])
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def read_process_rss(pid):
+    """Return the resident set size of a process in bytes, or 0 if it can't be read"""
+    try:
+        with open(f"/proc/{pid}/status", 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def read_process_stats(pid):
+    """Return RSS and PSS in bytes and consumed CPU seconds of a process from /proc"""
+    stats = {'rss': read_process_rss(pid), 'pss': 0, 'cpu_seconds': 0.0}
+    try:
+        # smaps_rollup is much cheaper than summing /proc/<pid>/smaps
+        with open(f"/proc/{pid}/smaps_rollup", 'r') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    stats['pss'] = int(line.split()[1]) * 1024
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        with open(f"/proc/{pid}/stat", 'r') as f:
+            # The command name may contain spaces, so split after its closing parenthesis
+            fields = f.read().rsplit(')', 1)[1].split()
+        # utime and stime are fields 14 and 15 of the full line
+        stats['cpu_seconds'] = (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        pass
+    return stats
+
+
+class LazyTabPlaceholder(QWidget):
+    """Lightweight stand-in for a tab whose web view has not been created yet"""
+    
+    def __init__(self, title, url, tab_config=None, parent=None):
+        super().__init__(parent)
+        # Deliberately not named url/title so hasattr(widget, 'url') checks skip placeholders
+        self.pending_title = title
+        self.pending_url = url
+        self.tab_config = tab_config or {}
+        
+        layout = QVBoxLayout(self)
+        label = QLabel(f"{title}\n{url}")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(label)
+
+class TabLabelModel(QObject):
+    """Tab bar labels built from cached, pre-truncated titles and flushed once per event-loop pass
+    
+    Title and URL signals only mark a tab dirty; flush() then renders each dirty
+    label and calls setTabText (which relayouts the tab bar) only if the text changed.
+    """
+    
+    MAX_TITLE_LENGTH = 25    # Leaves room for the shortcut indicator
+    SHORTCUT_TABS = 10       # Tabs reachable with Alt+1..Alt+0
+    
+    def __init__(self, tab_widget, parent=None):
+        super().__init__(parent)
+        self.tab_widget = tab_widget
+        self.titles = {}         # page widget -> truncated configured title
+        self.dirty = set()
+        self.flush_pending = False
+    
+    @classmethod
+    def truncate(cls, title):
+        """Shorten a title to fit the tab"""
+        if len(title) > cls.MAX_TITLE_LENGTH:
+            return title[:cls.MAX_TITLE_LENGTH - 3] + "..."
+        return title
+    
+    def set_title(self, widget, title):
+        """Cache the configured title of a tab"""
+        self.titles[widget] = self.truncate(title)
+        self.mark_dirty(widget)
+    
+    def replace(self, old_widget, new_widget):
+        """Carry the cached title over when a tab's page widget is swapped"""
+        if old_widget in self.titles:
+            self.titles[new_widget] = self.titles.pop(old_widget)
+        self.dirty.discard(old_widget)
+        self.mark_dirty(new_widget)
+    
+    def forget(self, widget):
+        """Drop a removed tab"""
+        self.titles.pop(widget, None)
+        self.dirty.discard(widget)
+    
+    def mark_dirty(self, widget):
+        """Schedule a label update for the next event-loop pass"""
+        self.dirty.add(widget)
+        if not self.flush_pending:
+            self.flush_pending = True
+            QTimer.singleShot(0, self.flush)
+    
+    def mark_all_dirty(self):
+        """Schedule every label, e.g. after tabs moved and their shortcuts changed"""
+        for i in range(self.tab_widget.count()):
+            self.mark_dirty(self.tab_widget.widget(i))
+    
+    def label(self, index, widget):
+        """Render the label of the tab at index"""
+        title = self.titles.get(widget)
+        if title is None:
+            # Tabs without a configured title show their URL
+            title = self.truncate(widget.url().toString() if isinstance(widget, BrowserTab) else "New Tab")
+            self.titles[widget] = title
+        if index < self.SHORTCUT_TABS:
+            # The tenth tab is Alt+0
+            return f"(Alt+{(index + 1) % 10}) {title}"
+        return title
+    
+    def flush(self):
+        """Apply all pending label changes"""
+        self.flush_pending = False
+        dirty, self.dirty = self.dirty, set()
+        for widget in dirty:
+            index = self.tab_widget.indexOf(widget)
+            if index < 0:
+                continue
+            text = self.label(index, widget)
+            if self.tab_widget.tabText(index) != text:
+                self.tab_widget.setTabText(index, text)
+
+# Anything but letters and digits separates words in tab search (e.g. the parts of a URL)
+SEARCH_SEPARATORS = re.compile(r'[^a-z0-9]+')
+
+def search_text(text):
+    """Lower-case text with runs of punctuation collapsed to one space, so URLs split into words"""
+    return SEARCH_SEPARATORS.sub(' ', text.lower()).strip()
+
+def trigrams(text, padded=True):
+    """Return the trigrams of normalized text, padded so word starts and ends form trigrams too"""
+    if padded:
+        text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class TabSearchIndex:
+    """Trigram index over a tab set's configured titles, URLs and live page titles
+    
+    Title changes only mark a tab dirty; it is re-indexed at the next search, so
+    chatty pages (unread counters) cost nothing until the switcher is used.
+    """
+    
+    MIN_MATCH = 0.5          # Share of the query's trigrams a tab must contain (tolerates typos)
+    
+    def __init__(self, tab_widget):
+        self.tab_widget = tab_widget
+        self.entries = {}        # page widget -> {'title', 'url', 'live_title', 'text', 'trigrams'}
+        self.postings = {}       # trigram -> set of page widgets
+        self.dirty = set()
+    
+    def set_entry(self, widget, title, url):
+        """Index the configured title and URL of a tab"""
+        entry = self.entries.setdefault(widget, {'live_title': '', 'text': '', 'trigrams': set()})
+        entry['title'] = title
+        entry['url'] = url
+        self.dirty.add(widget)
+    
+    def set_live_title(self, widget, title):
+        """Note a page title change, indexed at the next search"""
+        entry = self.entries.get(widget)
+        if entry is not None and entry['live_title'] != title:
+            entry['live_title'] = title
+            self.dirty.add(widget)
+    
+    def replace(self, old_widget, new_widget):
+        """Carry an entry over when a tab's page widget is swapped"""
+        entry = self.entries.get(old_widget)
+        self.forget(old_widget)
+        if entry is not None:
+            self.set_entry(new_widget, entry['title'], entry['url'])
+    
+    def forget(self, widget):
+        """Drop a removed tab"""
+        entry = self.entries.pop(widget, None)
+        self.dirty.discard(widget)
+        if entry is None:
+            return
+        for trigram in entry['trigrams']:
+            self.postings[trigram].discard(widget)
+    
+    def refresh(self):
+        """Re-index the tabs whose title or URL changed since the last search"""
+        dirty, self.dirty = self.dirty, set()
+        for widget in dirty:
+            entry = self.entries.get(widget)
+            if entry is None:
+                continue
+            text = search_text(f"{entry['title']} {entry['live_title']} {entry['url']}")
+            if text == entry['text']:
+                continue
+            new_trigrams = trigrams(text)
+            for trigram in entry['trigrams'] - new_trigrams:
+                self.postings[trigram].discard(widget)
+            for trigram in new_trigrams - entry['trigrams']:
+                self.postings.setdefault(trigram, set()).add(widget)
+            entry['text'] = text
+            entry['trigrams'] = new_trigrams
+    
+    def search(self, query):
+        """Return (score, widget) for every tab matching the query"""
+        self.refresh()
+        query = search_text(query)
+        if not query:
+            return [(0.0, widget) for widget in self.entries]
+        
+        # Too short for trigrams: score substrings and subsequences directly
+        if len(query) < 3:
+            return self.scan(query)
+        
+        # Count matching trigrams per tab through the postings instead of scanning every title;
+        # only the query's own trigrams, padding would tie them to word starts ("hub" in github)
+        query_trigrams = trigrams(query, padded=False)
+        counts = Counter()
+        for trigram in query_trigrams:
+            counts.update(self.postings.get(trigram, ()))
+        results = []
+        for widget, count in counts.items():
+            share = count / len(query_trigrams)
+            if share >= self.MIN_MATCH:
+                results.append((share + self.text_score(query, self.entries[widget]['text']), widget))
+        # Nothing shares enough trigrams (e.g. a typo in a short query): fall back to subsequences
+        return results or self.scan(query)
+    
+    def scan(self, query):
+        """Return (score, widget) for every tab whose text matches the query, without the index"""
+        scores = [(self.text_score(query, entry['text']), widget) for widget, entry in self.entries.items()]
+        return [(score, widget) for score, widget in scores if score > 0]
+    
+    @staticmethod
+    def text_score(query, text):
+        """Bonus for a word prefix (3), substring (2) or subsequence (1) match, else 0"""
+        position = text.find(query)
+        if position == 0 or (position > 0 and text[position - 1] == ' '):
+            return 3
+        if position > 0:
+            return 2
+        remaining = iter(text)
+        if all(char in remaining for char in query):
+            return 1
+        return 0
+
 class BrowserTab(QWebEngineView):
-    def __init__(self, url=None, profile=None):
+    # Set on views created by a PopupManager; they have no tabs.json entry
+    popup = False
+    
+    def __init__(self, url=None, profile=None, popups=None, tier_settings=()):
         if profile:
             super().__init__(profile)
         else:
             super().__init__()
+        # PopupManager that owns the windows this tab opens
+        self.popups = popups
+        
+        # Profile-wide defaults come from PROFILE_WEB_SETTINGS, only the tier's differences are set here
+        settings = self.settings()
+        for attribute, enabled in tier_settings:
+            settings.setAttribute(attribute, enabled)
+        
+        # Load after the settings so the first navigation already uses them
         if url:
-            from PyQt6.QtCore import QUrl
             self.setUrl(QUrl(url))
         
-        # Enable settings for better compatibility with modern websites
-        settings = self.settings()
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.XSSAuditingEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.SpatialNavigationEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.HyperlinkAuditingEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.ScrollAnimatorEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.ErrorPageEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.FullScreenSupportEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.ScreenCaptureEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanOpenWindows, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanAccessClipboard, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.AllowRunningInsecureContent, False)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.AllowGeolocationOnInsecureOrigins, False)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.PrintElementBackgrounds, True)
-        settings.setAttribute(QWebEngineSettings.WebAttribute.PdfViewerEnabled, True)
+        # Set up permission handling for microphone and camera access
+        self.setup_permission_handling()
+        
+        # Set up popup window handling
+        self.setup_popup_handling()
+    
+    def setup_permission_handling(self):
+        """Set up permission handling for microphone, camera, and other features"""
+        # Connect the feature permission requested signal
+        self.page().featurePermissionRequested.connect(self.handle_feature_permission_request)
+        
+        # Also connect the general permission requested signal for broader compatibility
+        self.page().permissionRequested.connect(self.handle_permission_request)
+        
+        log.debug("✓ Permission handling set up for microphone, camera, and other features")
+    
+    def handle_feature_permission_request(self, security_origin, feature):
+        """Handle feature permission requests (microphone, camera, etc.)"""
+        # Automatically grant permissions for media devices (microphone, camera)
+        if feature in [
+            QWebEnginePage.Feature.MediaAudioCapture,
+            QWebEnginePage.Feature.MediaVideoCapture,
+            QWebEnginePage.Feature.MediaAudioVideoCapture,
+            QWebEnginePage.Feature.DesktopAudioVideoCapture,
+            QWebEnginePage.Feature.DesktopVideoCapture
+        ]:
+            # Grant the permission
+            self.page().setFeaturePermission(
+                security_origin, 
+                feature, 
+                QWebEnginePage.PermissionPolicy.PermissionGrantedByUser
+            )
+            log.debug("🎤 Permission granted for %s from %s", feature, security_origin.host())
+            return
+        
+        # For other features, use the default behavior (ask user or deny)
+        log.debug("❓ Feature permission requested: %s from %s", feature, security_origin.host())
+    
+    def handle_permission_request(self, security_origin, permission):
+        """Handle general permission requests"""
+        # For now, we'll just log these requests
+        log.debug("🔐 Permission requested: %s from %s", permission, security_origin.host())
+    
+    def setup_popup_handling(self):
+        """Set up handling for popup windows"""
+        # Connect the signal for when a new window is requested
+        self.page().createWindow = self.handle_create_window
+        log.debug("✓ Popup window handling set up")
+    
+    def handle_create_window(self, window_type):
+        """Handle creation of new windows (popups)"""
+        log.debug("🪟 New window requested (type: %s)", window_type)
+        if self.popups:
+            return self.popups.create_popup(window_type)
+        
+        # Without a popup manager the view is only kept alive by Chromium
+        popup_tab = BrowserTab(profile=self.page().profile())
+        popup_tab.page().urlChanged.connect(lambda url: log.debug("🌐 Popup window URL changed: %s", url.toString()))
+        return popup_tab
+
+class PopupWindow(QWidget):
+    """Top-level window (parented to the browser) hosting a popup view"""
+    
+    def __init__(self, view, manager, parent=None):
+        super().__init__(parent, Qt.WindowType.Window)
+        self.view = view
+        self.manager = manager
+        self.setWindowTitle("Popup")
+        self.resize(800, 650)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(view)
+        view.titleChanged.connect(self.setWindowTitle)
+    
+    def closeEvent(self, event):
+        """Closing the window destroys the popup view"""
+        self.manager.close_popup(self.view)
+        super().closeEvent(event)
+
+class PopupManager(QObject):
+    """Show popups as parented windows or ephemeral tabs, cap their number and track leaks
+    
+    A view is destroyed when its page requests a close, when its window or tab
+    is closed, or when it is the oldest popup and the cap is reached.
+    """
+    
+    def __init__(self, browser, tab_set, settings=None):
+        super().__init__(browser)
+        settings = {**DEFAULT_POPUPS, **(settings or {})}
+        self.browser = browser
+        self.tab_set = tab_set
+        self.profile = tab_set.profile
+        self.mode = settings['mode']
+        self.max_popups = max(1, int(settings['max_popups']))
+        self.pool_size = int(settings['pool_size'])
+        self.pool = []
+        self.open = []           # popup views, oldest first
+        self.containers = {}     # view -> PopupWindow, or the tab set for tab popups
+        self.alive = set()       # every view created here that Qt has not destroyed yet
+        self.closing = set()     # closed views waiting for deleteLater
+        self.created = 0
+        
+        # Fill the pool once startup is over
+        QTimer.singleShot(2000, self.fill_pool)
+    
+    def new_view(self):
+        """Create a view that can host a popup"""
+        view = BrowserTab(profile=self.profile, popups=self)
+        # Popups are not configured tabs: no tabs.json entry, session or snapshot
+        view.popup = True
+        view.tab_set = self.tab_set
+        self.created += 1
+        self.alive.add(view)
+        view.destroyed.connect(lambda obj=None, v=view: self.view_destroyed(v))
+        return view
+    
+    def view_destroyed(self, view):
+        """Forget a view once Qt has deleted it"""
+        self.alive.discard(view)
+        self.closing.discard(view)
+        if view in self.open:
+            self.open.remove(view)
+            self.containers.pop(view, None)
+    
+    def fill_pool(self):
+        """Pre-create views up to pool_size (an unused view has no renderer yet)"""
+        while len(self.pool) < self.pool_size:
+            self.pool.append(self.new_view())
+    
+    def create_popup(self, window_type):
+        """Return a view for Chromium to load the popup into, shown as a window or tab"""
+        while len(self.open) >= self.max_popups:
+            self.close_popup(self.open[0])
+        
+        view = self.pool.pop(0) if self.pool else self.new_view()
+        QTimer.singleShot(0, self.fill_pool)
+        view.page().windowCloseRequested.connect(lambda v=view: self.close_popup(v))
+        self.open.append(view)
+        
+        as_tab = self.mode == 'tab' or (self.mode == 'auto' and window_type in (
+            QWebEnginePage.WebWindowType.WebBrowserTab, QWebEnginePage.WebWindowType.WebBrowserBackgroundTab))
+        if as_tab:
+            # Popup tabs go after the configured tabs of the set whose page opened them
+            tab_set = self.tab_set
+            index = tab_set.tab_widget.addTab(view, "Popup")
+            tab_set.tab_labels.set_title(view, "Popup")
+            tab_set.tab_search.set_entry(view, "Popup", "")
+            view.titleChanged.connect(lambda title, v=view: tab_set.tab_labels.set_title(v, title or "Popup"))
+            view.titleChanged.connect(lambda title, v=view: tab_set.tab_search.set_live_title(v, title))
+            view.urlChanged.connect(lambda url, v=view: tab_set.tab_search.set_entry(v, "Popup", url.toString()))
+            if window_type != QWebEnginePage.WebWindowType.WebBrowserBackgroundTab:
+                tab_set.tab_widget.setCurrentIndex(index)
+            self.containers[view] = tab_set
+        else:
+            window = PopupWindow(view, self, self.browser)
+            self.containers[view] = window
+            window.show()
+        
+        log.debug("🪟 Popup opened as %s (%s open)", "tab" if as_tab else "window", len(self.open))
+        return view
+    
+    def close_popup(self, view):
+        """Destroy a popup view and its window or tab"""
+        if view not in self.open:
+            return
+        self.open.remove(view)
+        window = self.containers.pop(view, None)
+        self.closing.add(view)
+        # A tab popup may have been captured for the overview and tracked while selected
+        self.browser.forget_tab(view)
+        try:
+            if isinstance(window, PopupWindow):
+                window.hide()
+                window.deleteLater()
+            elif window is not None:
+                index = window.tab_widget.indexOf(view)
+                if index >= 0:
+                    window.tab_widget.removeTab(index)
+                window.tab_labels.forget(view)
+                window.tab_search.forget(view)
+            view.deleteLater()
+        except RuntimeError:
+            # Already deleted along with its window or the browser
+            pass
+        log.debug("🪟 Popup closed (%s open)", len(self.open))
+    
+    def stats(self):
+        """Return popup counters; leaked views are live views that are neither open, pooled nor being closed"""
+        return {
+            'open': len(self.open),
+            'pooled': len(self.pool),
+            'created': self.created,
+            'destroyed': self.created - len(self.alive),
+            'leaked': len(self.alive - set(self.open) - set(self.pool) - self.closing)
+        }
+
+class TabHibernationManager(QObject):
+    """Discard least recently used background tabs when a memory budget is exceeded"""
+    
+    def __init__(self, browser, settings=None):
+        super().__init__(browser)
+        self.browser = browser
+        settings = {**DEFAULT_HIBERNATION, **(settings or {})}
+        self.max_live_tabs = settings['max_live_tabs']
+        self.max_rss_mb = settings['max_rss_mb']
+        self.psi_threshold = settings['psi_threshold']
+        
+        # BrowserTabs in activation order, most recently used last
+        self.activation_order = []
+        
+        # Counters
+        self.evictions = 0
+        self.restores = 0
+        
+        # Periodic check so RSS and memory pressure are noticed without a tab switch
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.enforce_budget)
+        self.timer.start(int(settings['check_interval_s'] * 1000))
+    
+    def tab_activated(self, index):
+        """Record a tab activation and restore the tab if it was discarded"""
+        tab = self.browser.tab_widget.widget(index)
+        if not isinstance(tab, BrowserTab):
+            return
+        
+        if tab.page().lifecycleState() == QWebEnginePage.LifecycleState.Discarded:
+            self.restore(tab)
+        
+        if tab in self.activation_order:
+            self.activation_order.remove(tab)
+        self.activation_order.append(tab)
+        
+        self.enforce_budget()
+    
+    def forget(self, tab):
+        """Drop a removed tab from the activation order"""
+        if tab in self.activation_order:
+            self.activation_order.remove(tab)
+    
+    def live_tabs(self):
+        """Return all BrowserTabs that still hold a renderer"""
+        # Popups are short-lived and bounded by max_popups, discarding one would break its flow (e.g. a login)
+        return [tab for tab in self.browser.browser_tabs(popups=False)
+                if tab.page().lifecycleState() != QWebEnginePage.LifecycleState.Discarded]
+    
+    def eviction_candidates(self, live_tabs):
+        """Return background tabs that can be discarded, least recently used first"""
+        current = self.browser.tab_widget.currentWidget()
+        # Drop tabs that no longer exist
+        self.activation_order = [tab for tab in self.activation_order if tab in live_tabs or tab is current]
+        
+        # Tabs that were loaded but never looked at go first, then by activation order
+        never_activated = [tab for tab in live_tabs if tab not in self.activation_order]
+        candidates = never_activated + self.activation_order
+        
+        # Only discard where Qt says it is safe (no audio playback, no unsaved form input)
+        return [tab for tab in candidates
+                if tab is not current
+                and tab in live_tabs
+                and not getattr(tab, 'tab_config', {}).get('keep_alive', False)
+                and not getattr(tab, 'prewarmed', False)
+                and tab.page().recommendedState() == QWebEnginePage.LifecycleState.Discarded]
+    
+    def total_rss_mb(self, live_tabs):
+        """Return the RSS of the browser process plus all live renderer processes in MB"""
+        pids = {os.getpid()}
+        for tab in live_tabs:
+            pid = tab.page().renderProcessPid()
+            if pid > 0:
+                pids.add(pid)
+        return sum(read_process_rss(pid) for pid in pids) / (1024 * 1024)
+    
+    def enforce_budget(self):
+        """Discard background tabs until the tab-count budget holds, and one more under memory pressure"""
+        live_tabs = self.live_tabs()
+        candidates = self.eviction_candidates(live_tabs)
+        
+        if self.max_live_tabs > 0:
+            excess = len(live_tabs) - self.max_live_tabs
+            while excess > 0 and candidates:
+                self.discard(candidates.pop(0), "tab budget")
+                live_tabs = self.live_tabs()
+                excess -= 1
+        
+        if not candidates:
+            return
+        
+        # RSS and PSI only drop after the renderer has exited, so discard one tab per check
+        if self.max_rss_mb > 0:
+            rss_mb = self.total_rss_mb(live_tabs)
+            if rss_mb > self.max_rss_mb:
+                self.discard(candidates.pop(0), f"RSS {rss_mb:.0f} MB > {self.max_rss_mb} MB")
+                return
+        
+        if self.psi_threshold > 0:
+            pressure = read_memory_pressure()
+            if pressure is not None and pressure > self.psi_threshold:
+                self.discard(candidates.pop(0), f"memory pressure {pressure:.1f}%")
+    
+    def discard(self, tab, reason):
+        """Free the renderer of a background tab, keeping its URL, history and zoom"""
+        tab.hibernated_zoom = tab.zoomFactor()
+        tab.page().setLifecycleState(QWebEnginePage.LifecycleState.Discarded)
+        self.evictions += 1
+        log.info("💤 Discarded tab (%s): %s", reason, tab.url().toString())
+    
+    def restore(self, tab):
+        """Bring a discarded tab back to life"""
+        tab.page().setLifecycleState(QWebEnginePage.LifecycleState.Active)
+        zoom = getattr(tab, 'hibernated_zoom', None)
+        if zoom is not None:
+            tab.setZoomFactor(zoom)
+        self.restores += 1
+        log.info("⏰ Restored discarded tab: %s", tab.url().toString())
+    
+    def stats(self):
+        """Return eviction and restore counters"""
+        return {
+            'evictions': self.evictions,
+            'restores': self.restores,
+            'live_tabs': len(self.live_tabs())
+        }
+
+class TabLifecycleScheduler(QObject):
+    """Freeze background tabs after an idle period and wake them instantly when selected"""
+    
+    def __init__(self, browser, settings=None):
+        super().__init__(browser)
+        self.browser = browser
+        settings = {**DEFAULT_LIFECYCLE, **(settings or {})}
+        self.freeze_after = settings['freeze_after_s']
+        
+        self.current_tab = None
+        self.hidden_since = {}   # BrowserTab -> monotonic time it left the view
+        self.state_stats = {}    # BrowserTab -> {'state', 'since', 'totals'}
+        
+        # One low-frequency timer instead of a timer per tab
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.freeze_idle_tabs)
+        self.timer.start(int(max(1, min(30, self.freeze_after / 4)) * 1000))
+    
+    def register(self, tab):
+        """Start tracking time-in-state for a tab"""
+        if tab in self.state_stats:
+            return
+        state = tab.page().lifecycleState()
+        self.state_stats[tab] = {'state': state, 'since': time.monotonic(), 'totals': {}}
+        tab.page().lifecycleStateChanged.connect(lambda state, t=tab: self.record_state(t, state))
+        # Removal paths call forget(), this also covers tabs deleted along with their window
+        tab.destroyed.connect(lambda obj=None, t=tab: self.forget(t))
+    
+    def forget(self, tab):
+        """Stop tracking a tab that was removed or deleted"""
+        self.state_stats.pop(tab, None)
+        self.hidden_since.pop(tab, None)
+        if self.current_tab is tab:
+            self.current_tab = None
+    
+    def record_state(self, tab, state):
+        """Account the time spent in the previous state"""
+        stats = self.state_stats.get(tab)
+        if stats is None:
+            return
+        now = time.monotonic()
+        name = stats['state'].name
+        stats['totals'][name] = stats['totals'].get(name, 0.0) + now - stats['since']
+        stats['state'] = state
+        stats['since'] = now
+    
+    def tab_activated(self, index):
+        """Wake the selected tab and start the idle clock of the one that was left"""
+        tab = self.browser.tab_widget.widget(index)
+        
+        if self.current_tab is not None and self.current_tab is not tab:
+            self.hidden_since[self.current_tab] = time.monotonic()
+        
+        if not isinstance(tab, BrowserTab):
+            self.current_tab = None
+            return
+        
+        self.register(tab)
+        self.current_tab = tab
+        self.hidden_since.pop(tab, None)
+        if tab.page().lifecycleState() == QWebEnginePage.LifecycleState.Frozen:
+            tab.page().setLifecycleState(QWebEnginePage.LifecycleState.Active)
+            log.debug("▶️  Unfroze tab: %s", tab.url().toString())
+    
+    def freeze_idle_tabs(self):
+        """Freeze background tabs that have been out of view for longer than freeze_after"""
+        now = time.monotonic()
+        # Popups stay active, a background login popup may still be talking to its opener
+        tabs = [tab for tab in self.browser.browser_tabs(popups=False) if not sip.isdeleted(tab)]
+        # Forget tabs that no longer exist
+        self.hidden_since = {tab: since for tab, since in self.hidden_since.items() if tab in tabs}
+        self.state_stats = {tab: stats for tab, stats in self.state_stats.items() if tab in tabs}
+        
+        for tab in tabs:
+            if tab is self.current_tab:
+                continue
+            self.register(tab)
+            # Tabs loaded in the background count as hidden from the first check on
+            since = self.hidden_since.setdefault(tab, now)
+            if now - since < self.freeze_after:
+                continue
+            if getattr(tab, 'tab_config', {}).get('keep_alive', False) or getattr(tab, 'prewarmed', False):
+                continue
+            
+            page = tab.page()
+            # Respect Qt's recommendation (e.g. audio playing) and leave discarded tabs alone
+            if (page.lifecycleState() == QWebEnginePage.LifecycleState.Active
+                    and page.recommendedState() != QWebEnginePage.LifecycleState.Active):
+                page.setLifecycleState(QWebEnginePage.LifecycleState.Frozen)
+                log.debug("🧊 Froze idle background tab: %s", tab.url().toString())
+    
+    def stats(self):
+        """Return per-tab seconds spent in each lifecycle state"""
+        now = time.monotonic()
+        result = []
+        for tab, stats in list(self.state_stats.items()):
+            # A tab deleted since the last tick can't be asked for its URL any more
+            if sip.isdeleted(tab):
+                self.forget(tab)
+                continue
+            totals = dict(stats['totals'])
+            name = stats['state'].name
+            totals[name] = totals.get(name, 0.0) + now - stats['since']
+            result.append({
+                'url': tab.url().toString(),
+                'state': name,
+                'seconds_in_state': {state: round(seconds, 1) for state, seconds in totals.items()}
+            })
+        return result
+
+def tab_usage_key(widget):
+    """Return the configured URL that identifies a tab across restarts and tabs.json reloads"""
+    tab_config = getattr(widget, 'tab_config', None) or {}
+    return tab_config.get('url') or getattr(widget, 'pending_url', None) or getattr(widget, 'session_key', None)
+
+class TabUsageStats:
+    """Switch counts, recency and hour-of-day buckets per tab, persisted as usage.json in the profile directory"""
+    
+    def __init__(self, profile_dir, half_life_days=DEFAULT_PREWARM['half_life_days']):
+        self.path = os.path.join(profile_dir, "usage.json")
+        self.half_life_s = half_life_days * 86400
+        self.tabs = {}    # tab key -> {'count', 'last', 'hours'}
+        self.dirty = False
+        try:
+            with open(self.path, 'r') as f:
+                self.tabs = json.load(f).get('tabs', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+    
+    def record(self, key, now=None):
+        """Count a switch to the tab"""
+        now = now or time.time()
+        stats = self.tabs.setdefault(key, {'count': 0, 'last': 0, 'hours': [0] * 24})
+        stats['count'] += 1
+        stats['last'] = now
+        stats['hours'][time.localtime(now).tm_hour] += 1
+        self.dirty = True
+    
+    def score(self, key, now=None):
+        """Likelihood-style score: switches (weighted toward this hour of day) decayed by time since last use"""
+        stats = self.tabs.get(key)
+        if not stats:
+            return 0.0
+        now = now or time.time()
+        this_hour = stats['hours'][time.localtime(now).tm_hour]
+        decay = 0.5 ** (max(0.0, now - stats['last']) / self.half_life_s)
+        return (stats['count'] + 3 * this_hour) * decay
+    
+    def save(self):
+        """Write the stats if anything changed"""
+        if not self.dirty:
+            return
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'tabs': self.tabs}, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            log.warning("⚠️  Error saving tab usage: %s", e)
+
+class TabPrewarmScheduler(QObject):
+    """Keep the tabs most likely to be switched to next loaded and active, exempt from hibernation and freezing"""
+    
+    def __init__(self, browser, profile_dir, settings=None):
+        super().__init__(browser)
+        settings = {**DEFAULT_PREWARM, **(settings or {})}
+        self.browser = browser
+        self.top_k = settings['top_k']
+        self.usage = TabUsageStats(profile_dir, settings['half_life_days'])
+        self.previous_key = None
+        self.current_key = None
+        
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.prewarm)
+        self.timer.start(int(settings['check_interval_s'] * 1000))
+        QApplication.instance().aboutToQuit.connect(self.usage.save)
+    
+    def record_switch(self, index):
+        """Record a user-initiated switch to the tab at index"""
+        key = tab_usage_key(self.browser.tab_widget.widget(index))
+        if key is None:
+            return
+        self.usage.record(key)
+        if key != self.current_key:
+            self.previous_key, self.current_key = self.current_key, key
+    
+    def predicted_tabs(self):
+        """Return the indexes of the top_k most likely next tabs, best first"""
+        tab_widget = self.browser.tab_widget
+        current = tab_widget.currentIndex()
+        scores = []
+        for i in range(tab_widget.count()):
+            if i == current:
+                continue
+            key = tab_usage_key(tab_widget.widget(i))
+            score = self.usage.score(key)
+            # Switching back to the tab just left is the most common next move
+            if key is not None and key == self.previous_key:
+                score += 1000
+            if score > 0:
+                scores.append((score, i))
+        scores.sort(reverse=True)
+        return [i for _, i in scores[:self.top_k]]
+    
+    def prewarm(self):
+        """Load and wake the predicted tabs, release the exemption of the rest"""
+        warm = set()
+        for index in self.predicted_tabs():
+            tab = self.browser.ensure_tab_loaded(index)
+            if not isinstance(tab, BrowserTab):
+                continue
+            warm.add(tab)
+            if not getattr(tab, 'prewarmed', False):
+                tab.prewarmed = True
+                log.debug("🔥 Prewarmed tab %s: %s", index + 1, tab_usage_key(tab))
+            
+            state = tab.page().lifecycleState()
+            if state == QWebEnginePage.LifecycleState.Discarded and self.browser.hibernation:
+                self.browser.hibernation.restore(tab)
+            elif state != QWebEnginePage.LifecycleState.Active:
+                tab.page().setLifecycleState(QWebEnginePage.LifecycleState.Active)
+        
+        for tab in self.browser.browser_tabs():
+            if tab not in warm:
+                tab.prewarmed = False
+        self.usage.save()
+    
+    def stats(self):
+        """Return the usage score and prewarm state per tab"""
+        tab_widget = self.browser.tab_widget
+        result = []
+        for i in range(tab_widget.count()):
+            widget = tab_widget.widget(i)
+            key = tab_usage_key(widget)
+            result.append({
+                'url': key,
+                'score': round(self.usage.score(key), 2),
+                'switches': self.usage.tabs.get(key, {}).get('count', 0),
+                'prewarmed': getattr(widget, 'prewarmed', False)
+            })
+        return result
+
+class ReloadScheduler(QObject):
+    """Reload the visible tab first and the rest a few at a time instead of all at once
+    
+    The next queued reload starts when a running one emits loadFinished or times out.
+    """
+    
+    def __init__(self, browser, settings=None):
+        super().__init__(browser)
+        settings = {**DEFAULT_RELOAD, **(settings or {})}
+        self.browser = browser
+        self.max_concurrent = max(1, int(settings['max_concurrent']))
+        self.timeout_ms = int(settings['timeout_s'] * 1000)
+        self.stale_background = settings['stale_background']
+        self.queue = []
+        self.running = {}    # tab -> (loadFinished slot, timeout timer)
+    
+    def reload(self, tabs, stale_background=None):
+        """Reload tabs: the current one right away, the others queued or marked stale"""
+        if stale_background is None:
+            stale_background = self.stale_background
+        current = self.browser.tab_widget.currentWidget()
+        
+        for tab in tabs:
+            if not isinstance(tab, BrowserTab):
+                continue
+            if tab is current:
+                self.start(tab)
+                continue
+            
+            state = tab.page().lifecycleState()
+            if state == QWebEnginePage.LifecycleState.Discarded:
+                # Restoring a discarded tab loads it fresh anyway
+                continue
+            if stale_background or state == QWebEnginePage.LifecycleState.Frozen:
+                # Reloading would wake a frozen tab, so wait until it is selected
+                tab.stale = True
+            elif tab not in self.queue and tab not in self.running:
+                self.queue.append(tab)
+        self.pump()
+    
+    def pump(self):
+        """Start queued reloads up to the concurrency limit"""
+        while self.queue and len(self.running) < self.max_concurrent:
+            self.start(self.queue.pop(0))
+    
+    def start(self, tab):
+        """Reload one tab and watch for it to finish"""
+        if tab in self.queue:
+            self.queue.remove(tab)
+        if tab in self.running:
+            # Restarting keeps this tab's slot, so don't let the next queued tab take it
+            self.finish(tab, pump=False)
+        tab.stale = False
+        
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda t=tab: self.finish(t))
+        slot = lambda ok, t=tab: self.finish(t)
+        try:
+            tab.loadFinished.connect(slot)
+            tab.reload()
+        except RuntimeError:
+            # The tab was removed (tabs.json reload) while it was queued; a restart's slot is free again
+            timer.deleteLater()
+            self.pump()
+            return
+        timer.start(self.timeout_ms)
+        self.running[tab] = (slot, timer)
+        log.debug("🔄 Reloading %s", tab.url().toString())
+    
+    def finish(self, tab, pump=True):
+        """Stop watching a tab and start the next queued reload"""
+        slot, timer = self.running.pop(tab, (None, None))
+        if timer is None:
+            return
+        timer.stop()
+        timer.deleteLater()
+        try:
+            tab.loadFinished.disconnect(slot)
+        except (RuntimeError, TypeError):
+            pass
+        if pump:
+            self.pump()
+    
+    def forget(self, tab):
+        """Drop a removed tab from the queue and free its slot if it was reloading"""
+        if tab in self.queue:
+            self.queue.remove(tab)
+        self.finish(tab)
+    
+    def tab_activated(self, index):
+        """Reload a stale tab when it is selected"""
+        tab = self.browser.tab_widget.widget(index)
+        if getattr(tab, 'stale', False):
+            self.start(tab)
+
+class ThumbnailCache:
+    """Downscaled screenshots of tabs for the tab overview, bounded by a byte budget
+    
+    A tab is captured with grab() while it is still the visible one, right before
+    the user switches away, so capturing never wakes a frozen or discarded tab.
+    """
+    
+    def __init__(self, settings=None):
+        settings = {**DEFAULT_THUMBNAILS, **(settings or {})}
+        self.budget = int(settings['budget_mb'] * 1024 * 1024)
+        self.width = int(settings['width'])
+        self.entries = OrderedDict()  # page widget -> (pixmap, bytes), least recently captured first
+        self.size = 0
+        self.captures = 0
+        self.evictions = 0
+    
+    def capture(self, widget):
+        """Store a downscaled screenshot of a visible tab"""
+        if not self.budget or not isinstance(widget, BrowserTab) or not widget.isVisible():
+            return
+        
+        pixmap = widget.grab()
+        if pixmap.isNull():
+            return
+        pixmap = pixmap.scaledToWidth(min(self.width, pixmap.width()), Qt.TransformationMode.SmoothTransformation)
+        self.put(widget, pixmap)
+    
+    def put(self, widget, pixmap):
+        """Add or replace a thumbnail and evict the oldest ones until the budget fits"""
+        self.invalidate(widget)
+        cost = pixmap.width() * pixmap.height() * pixmap.depth() // 8
+        self.entries[widget] = (pixmap, cost)
+        self.size += cost
+        self.captures += 1
+        
+        while self.size > self.budget and self.entries:
+            _, (_, evicted_cost) = self.entries.popitem(last=False)
+            self.size -= evicted_cost
+            self.evictions += 1
+    
+    def get(self, widget):
+        """Return the cached thumbnail of a tab, or None"""
+        entry = self.entries.get(widget)
+        return entry[0] if entry else None
+    
+    def invalidate(self, widget):
+        """Drop the thumbnail of a tab, e.g. because it loaded new content or was removed"""
+        entry = self.entries.pop(widget, None)
+        if entry:
+            self.size -= entry[1]
+    
+    def stats(self):
+        """Return thumbnail count and memory use"""
+        return {
+            'thumbnails': len(self.entries),
+            'size_mb': round(self.size / (1024 * 1024), 1),
+            'budget_mb': round(self.budget / (1024 * 1024), 1),
+            'captures': self.captures,
+            'evictions': self.evictions
+        }
+
+class TabTelemetry(QObject):
+    """Map tabs to their renderer processes and sample RSS, PSS and CPU time from /proc"""
+    
+    sampled = pyqtSignal()
+    
+    def __init__(self, browser, interval_s=TELEMETRY_INTERVAL_S):
+        super().__init__(browser)
+        self.browser = browser
+        self.dump_path = None
+        self.last_cpu = {}       # pid -> (monotonic time, cpu seconds)
+        self.snapshot_data = {}
+        
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.sample)
+        self.timer.start(int(interval_s * 1000))
+    
+    def sample_process(self, pid, now):
+        """Sample one process and derive its CPU usage since the previous sample"""
+        stats = read_process_stats(pid)
+        previous = self.last_cpu.get(pid)
+        cpu_percent = None
+        if previous and now > previous[0]:
+            cpu_percent = 100.0 * (stats['cpu_seconds'] - previous[1]) / (now - previous[0])
+        self.last_cpu[pid] = (now, stats['cpu_seconds'])
+        return {
+            'pid': pid,
+            'rss_mb': round(stats['rss'] / (1024 * 1024), 1),
+            'pss_mb': round(stats['pss'] / (1024 * 1024), 1),
+            'cpu_seconds': round(stats['cpu_seconds'], 2),
+            'cpu_percent': None if cpu_percent is None else round(cpu_percent, 1)
+        }
+    
+    def sample(self):
+        """Take a snapshot of every tab and its renderer process"""
+        now = time.monotonic()
+        tab_sets = self.browser.tab_sets
+        
+        # Several tabs can share a renderer (process-per-site), so sample each PID once
+        tab_pids = {}
+        for tab in self.browser.browser_tabs():
+            pid = tab.page().renderProcessPid()
+            if pid > 0:
+                tab_pids.setdefault(pid, []).append(tab)
+        processes = {pid: self.sample_process(pid, now) for pid in tab_pids}
+        
+        tabs = []
+        for tab_set in tab_sets.values():
+            tab_widget = tab_set.tab_widget
+            for i in range(tab_widget.count()):
+                tabs.append(self.tab_entry(tab_set, i, processes, tab_pids))
+        
+        # Forget processes that have exited
+        self.last_cpu = {pid: value for pid, value in self.last_cpu.items() if pid in processes or pid == os.getpid()}
+        
+        popups = [tab_set.popups.stats() for tab_set in tab_sets.values()]
+        self.snapshot_data = {
+            'timestamp': time.time(),
+            'browser': self.sample_process(os.getpid(), now),
+            'renderers': len(processes),
+            'total_rss_mb': round(sum(p['rss_mb'] for p in processes.values()) + read_process_rss(os.getpid()) / (1024 * 1024), 1),
+            'tab_set': self.browser.tab_set.name,
+            'tab_sets': list(tab_sets),
+            'tabs': tabs,
+            'hibernation': self.browser.hibernation.stats() if self.browser.hibernation else None,
+            'lifecycle': self.browser.lifecycle.stats() if self.browser.lifecycle else None,
+            'prewarm': self.browser.prewarm.stats() if self.browser.prewarm else None,
+            'popups': {key: sum(stats[key] for stats in popups) for key in popups[0]},
+            'http_cache': {name: tab_set.http_cache.summary() for name, tab_set in tab_sets.items()},
+            'blocked_requests': self.browser.request_blocker.stats() if self.browser.request_blocker else None,
+            'thumbnails': self.browser.thumbnails.stats()
+        }
+        
+        if self.dump_path:
+            self.dump(self.dump_path)
+        self.sampled.emit()
+        return self.snapshot_data
+    
+    def tab_entry(self, tab_set, i, processes, tab_pids):
+        """Describe the tab at index i of a tab set"""
+        tab_widget = tab_set.tab_widget
+        widget = tab_widget.widget(i)
+        entry = {'tab_set': tab_set.name, 'index': i, 'title': tab_widget.tabText(i)}
+        if isinstance(widget, BrowserTab):
+            pid = widget.page().renderProcessPid()
+            entry['url'] = widget.url().toString()
+            entry['state'] = widget.page().lifecycleState().name
+            entry['tier'] = getattr(widget, 'tab_config', {}).get('tier', self.browser.config.get('default_tier', DEFAULT_TIER))
+            entry['popup'] = widget.popup
+            if pid in processes:
+                entry.update(processes[pid])
+                entry['shared_process'] = len(tab_pids[pid]) > 1
+            if self.browser.request_blocker:
+                entry['blocked_requests'] = self.browser.request_blocker.blocked_for(entry['url'])
+        elif isinstance(widget, SnapshotView):
+            entry['url'] = widget.session_key
+            entry['state'] = 'Snapshot'
+        else:
+            entry['url'] = getattr(widget, 'pending_url', '')
+            entry['state'] = 'Lazy'
+        return entry
+    
+    def snapshot(self):
+        """Return the latest snapshot, sampling first if there is none yet"""
+        return self.snapshot_data or self.sample()
+    
+    def dump(self, path):
+        """Write the latest snapshot as JSON"""
+        try:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.snapshot(), f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.warning("⚠️  Error writing stats to %s: %s", path, e)
+
+class TaskManagerDialog(QDialog):
+    """Per-tab renderer PID, memory and CPU usage, refreshed with every telemetry sample"""
+    
+    COLUMNS = ["Tab", "State", "PID", "RSS MB", "PSS MB", "CPU %", "CPU s", "Blocked"]
+    
+    def __init__(self, telemetry, parent=None):
+        super().__init__(parent)
+        self.telemetry = telemetry
+        self.setWindowTitle("Task Manager")
+        self.resize(900, 400)
+        
+        layout = QVBoxLayout(self)
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.table)
+        self.summary = QLabel()
+        layout.addWidget(self.summary)
+        
+        telemetry.sampled.connect(self.refresh)
+        telemetry.sample()
+    
+    def refresh(self):
+        """Fill the table from the latest snapshot"""
+        snapshot = self.telemetry.snapshot()
+        tabs = snapshot['tabs']
+        self.table.setRowCount(len(tabs))
+        for row, entry in enumerate(tabs):
+            title = entry['title'] if len(snapshot['tab_sets']) == 1 else f"[{entry['tab_set']}] {entry['title']}"
+            values = [
+                title, entry['state'], entry.get('pid', ''),
+                entry.get('rss_mb', ''), entry.get('pss_mb', ''),
+                entry.get('cpu_percent', ''), entry.get('cpu_seconds', ''),
+                entry.get('blocked_requests', '')
+            ]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem('' if value is None else str(value)))
+        
+        browser = snapshot['browser']
+        self.summary.setText(
+            f"Browser process {browser['pid']}: {browser['rss_mb']} MB RSS, "
+            f"{snapshot['renderers']} renderers, {snapshot['total_rss_mb']} MB RSS in total, "
+            f"{snapshot['popups']['open']} popups open ({snapshot['popups']['leaked']} leaked views)"
+        )
+
+# Chromium's "simple" disk cache backend stores each entry as <16 hex digit hash>_<stream> files
+SIMPLE_CACHE_ENTRY_FILE = re.compile(r'^([0-9a-f]{16})_([01s])$')
+SIMPLE_CACHE_MAGIC = 0xfcfb6d1ba7725c30
+SIMPLE_CACHE_HEADER = struct.Struct('<QIIII')  # magic, version, key length, key hash, padding; the key follows
+SIMPLE_CACHE_INDEX_FILE = "the-real-index"  # Rebuilt from the entry files when missing
+CACHE_KEY_URL = re.compile(r'[a-z][a-z0-9+.-]*://\S+$')
+
+def read_cache_entry_key(path):
+    """Return the cache key stored in the header of a simple cache entry file, or None"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(SIMPLE_CACHE_HEADER.size)
+            if len(header) < SIMPLE_CACHE_HEADER.size:
+                return None
+            magic, _version, key_length, _key_hash, _padding = SIMPLE_CACHE_HEADER.unpack(header)
+            if magic != SIMPLE_CACHE_MAGIC or key_length > 64 * 1024:
+                return None
+            return f.read(key_length).decode('utf-8', 'replace')
+    except OSError:
+        return None
+
+def cache_key_origin(key):
+    """Return the origin of the URL in a cache key
+
+    Keys look like "https://a.com/x.js" or, with a partitioned cache,
+    "1/0/_dk_https://a.com https://a.com https://a.com/x.js".
+    """
+    match = CACHE_KEY_URL.search(key)
+    return normalize_origin(match.group(0)) if match else None
+
+def scan_http_cache(cache_path):
+    """Group the entries of a simple disk cache by origin
+
+    Returns {origin: {'entries', 'bytes', 'last_used', 'files'}} where
+    last_used is the newest file mtime of the origin's entries.
+    """
+    entries = {}    # entry hash -> {'files', 'bytes', 'mtime', 'origin'}
+    for root, _dirs, files in os.walk(cache_path):
+        for name in files:
+            match = SIMPLE_CACHE_ENTRY_FILE.match(name)
+            if not match:
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entry = entries.setdefault(match.group(1), {'files': [], 'bytes': 0, 'mtime': 0.0, 'origin': None})
+            entry['files'].append(path)
+            entry['bytes'] += stat.st_size
+            entry['mtime'] = max(entry['mtime'], stat.st_mtime)
+            # Every stream file starts with the same header, so one key per entry is enough
+            if entry['origin'] is None:
+                key = read_cache_entry_key(path)
+                if key:
+                    entry['origin'] = cache_key_origin(key) or 'unknown'
+    
+    origins = {}
+    for entry in entries.values():
+        stats = origins.setdefault(entry['origin'] or 'unknown', {'entries': 0, 'bytes': 0, 'last_used': 0.0, 'files': []})
+        stats['entries'] += 1
+        stats['bytes'] += entry['bytes']
+        stats['last_used'] = max(stats['last_used'], entry['mtime'])
+        stats['files'].extend(entry['files'])
+    return origins
+
+class HttpCacheManager(QObject):
+    """Apply the HTTP cache policy to a profile and scan/prune the disk cache off the GUI thread"""
+    
+    scanned = pyqtSignal()
+    
+    def __init__(self, profile, profile_dir, settings=None, parent=None):
+        super().__init__(parent)
+        self.settings = {**DEFAULT_CACHE, **(settings or {})}
+        self.profile = profile
+        self.origins = {}
+        self.scanned_at = None
+        self.lock = threading.Lock()
+        self.worker = None
+        self.lock_file = None
+        self.scheduled = {}  # origin -> bytes of entries deleted at the next start
+        
+        mode = self.settings['mode']
+        if mode not in HTTP_CACHE_TYPES:
+            log.warning("⚠️  Unknown cache mode '%s', using disk", mode)
+            mode = self.settings['mode'] = 'disk'
+        path = os.path.expanduser(self.settings['path'] or "cache")
+        self.path = os.path.join(profile_dir, path)
+        self.prune_path = self.path + ".prune.json"
+        
+        # Before the profile opens the cache, so scheduled prunes run while no backend uses it
+        if mode == 'disk':
+            self.lock_cache()
+        
+        profile.setHttpCacheType(HTTP_CACHE_TYPES[mode])
+        profile.setHttpCacheMaximumSize(int(self.settings['max_size_mb']) * 1024 * 1024)
+        if mode == 'disk':
+            profile.setCachePath(self.path)
+        
+        size = f"{self.settings['max_size_mb']} MB" if self.settings['max_size_mb'] else "automatic size"
+        log.info("✓ HTTP cache: %s, %s%s", mode, size, f" at {self.path}" if mode == 'disk' else "")
+        
+        # First scan once startup is over, so telemetry has cache totals
+        QTimer.singleShot(5000, self.scan)
+    
+    def lock_cache(self):
+        """Hold a shared lock on the cache directory, pruning scheduled entries first if no other process uses it"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.lock_file = open(self.path + ".lock", 'a')
+            try:
+                fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                # Another MultiBrowser process has this cache open, prune on a later start
+                fcntl.flock(self.lock_file, fcntl.LOCK_SH)
+                return
+            self.run_scheduled_prune()
+            fcntl.flock(self.lock_file, fcntl.LOCK_SH)
+        except OSError as e:
+            log.warning("⚠️  Could not lock the HTTP cache at %s: %s", self.path, e)
+    
+    def run_scheduled_prune(self):
+        """Delete the entry files scheduled by prune() (only called while no cache backend is running)"""
+        try:
+            with open(self.prune_path, 'r') as f:
+                files = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        freed = 0
+        for path in files:
+            try:
+                freed += os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                pass
+        # The index still lists the removed entries, without it the backend rebuilds it from the files
+        for root, _dirs, names in os.walk(self.path):
+            if SIMPLE_CACHE_INDEX_FILE in names:
+                try:
+                    os.remove(os.path.join(root, SIMPLE_CACHE_INDEX_FILE))
+                except OSError:
+                    pass
+        try:
+            os.remove(self.prune_path)
+        except OSError:
+            pass
+        log.info("🧹 Pruned %s scheduled HTTP cache files, freed %.1f MB", len(files), freed / (1024 * 1024))
+    
+    def start_worker(self, target, *args):
+        """Run target on a background thread unless a scan or prune is already running"""
+        if self.settings['mode'] != 'disk' or (self.worker and self.worker.is_alive()):
+            return False
+        self.worker = threading.Thread(target=target, args=args, name="http-cache", daemon=True)
+        self.worker.start()
+        return True
+    
+    def scan(self):
+        """Rescan the cache directory in the background, emits scanned when done"""
+        return self.start_worker(self.run_scan)
+    
+    def run_scan(self):
+        """Worker: walk the cache directory and publish per-origin stats"""
+        origins = scan_http_cache(self.path)
+        with self.lock:
+            self.origins = origins
+            self.scanned_at = time.time()
+        # Queued to the GUI thread since this object lives there
+        self.scanned.emit()
+    
+    def stats(self):
+        """Return per-origin stats, largest first"""
+        with self.lock:
+            origins = [
+                {'origin': origin, 'entries': data['entries'],
+                 'size_mb': round(data['bytes'] / (1024 * 1024), 2), 'last_used': data['last_used']}
+                for origin, data in self.origins.items()
+            ]
+        return sorted(origins, key=lambda o: o['size_mb'], reverse=True)
+    
+    def summary(self):
+        """Return totals for telemetry snapshots"""
+        with self.lock:
+            total = sum(data['bytes'] for data in self.origins.values())
+            entries = sum(data['entries'] for data in self.origins.values())
+            origin_count = len(self.origins)
+        return {
+            'mode': self.settings['mode'],
+            'max_size_mb': self.settings['max_size_mb'],
+            'size_mb': round(total / (1024 * 1024), 1),
+            'entries': entries,
+            'origins': origin_count,
+            'scheduled_prune_mb': round(sum(self.scheduled.values()) / (1024 * 1024), 1),
+            'scanned_at': self.scanned_at
+        }
+    
+    def prune_candidates(self, strategy, count):
+        """Return the origins to prune: the largest or the least recently used"""
+        with self.lock:
+            if strategy == 'largest':
+                ranked = sorted(self.origins, key=lambda o: self.origins[o]['bytes'], reverse=True)
+            else:
+                ranked = sorted(self.origins, key=lambda o: self.origins[o]['last_used'])
+        return ranked[:count]
+    
+    def prune(self, origins):
+        """Schedule the cache entries of the given origins for deletion at the next start
+        
+        Deleting entry files underneath the running cache backend would leave its
+        index out of step with the disk, so they are removed before the profile opens the cache.
+        """
+        if self.settings['mode'] != 'disk':
+            return False
+        with self.lock:
+            origins = [origin for origin in origins if origin in self.origins]
+            files = [path for origin in origins for path in self.origins[origin]['files']]
+            for origin in origins:
+                self.scheduled[origin] = self.origins[origin]['bytes']
+        if not files:
+            return False
+        
+        try:
+            with open(self.prune_path, 'r') as f:
+                files = json.load(f) + files
+        except (OSError, ValueError):
+            pass
+        try:
+            tmp_path = self.prune_path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(sorted(set(files)), f)
+            os.replace(tmp_path, self.prune_path)
+        except OSError as e:
+            log.warning("⚠️  Error scheduling HTTP cache pruning: %s", e)
+            return False
+        log.info("🧹 Scheduled %s origins for pruning from the HTTP cache at the next start", len(origins))
+        self.scanned.emit()
+        return True
+
+class LogViewerDialog(QDialog):
+    """Recent log records from the in-memory ring buffer"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Log")
+        self.resize(900, 500)
+        
+        layout = QVBoxLayout(self)
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        layout.addWidget(self.text)
+        
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+        layout.addWidget(refresh_button)
+        self.refresh()
+    
+    def refresh(self):
+        """Show the buffered records and scroll to the newest one"""
+        if log_buffer not in log.handlers:
+            self.text.setPlainText('The log ring buffer is disabled ("logging": {"ring_buffer": 0})')
+            return
+        self.text.setPlainText("\n".join(log_buffer.lines()))
+        scroll_bar = self.text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+class HttpCacheDialog(QDialog):
+    """Per-origin HTTP cache usage with targeted pruning"""
+    
+    COLUMNS = ["Origin", "Entries", "Size MB", "Last used"]
+    PRUNE_COUNT = 3  # Origins pruned per "largest"/"stalest" click
+    
+    def __init__(self, cache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.setWindowTitle("HTTP Cache")
+        self.resize(800, 400)
+        
+        layout = QVBoxLayout(self)
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        layout.addWidget(self.table)
+        self.summary = QLabel()
+        layout.addWidget(self.summary)
+        
+        buttons = QHBoxLayout()
+        for label, handler in [
+            ("Rescan", self.cache.scan),
+            ("Prune Selected", self.prune_selected),
+            (f"Prune {self.PRUNE_COUNT} Largest", lambda: self.cache.prune(self.cache.prune_candidates('largest', self.PRUNE_COUNT))),
+            (f"Prune {self.PRUNE_COUNT} Stalest", lambda: self.cache.prune(self.cache.prune_candidates('stalest', self.PRUNE_COUNT)))
+        ]:
+            button = QPushButton(label)
+            button.clicked.connect(handler)
+            buttons.addWidget(button)
+        layout.addLayout(buttons)
+        
+        cache.scanned.connect(self.refresh)
+        self.refresh()
+        cache.scan()
+    
+    def prune_selected(self):
+        """Prune the origins of the selected rows"""
+        rows = {index.row() for index in self.table.selectedIndexes()}
+        self.cache.prune(self.table.item(row, 0).text() for row in rows)
+    
+    def refresh(self):
+        """Fill the table from the latest scan"""
+        origins = self.cache.stats()
+        self.table.setRowCount(len(origins))
+        for row, entry in enumerate(origins):
+            last_used = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['last_used']))
+            values = [entry['origin'], entry['entries'], entry['size_mb'], last_used]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(str(value)))
+        
+        summary = self.cache.summary()
+        if summary['mode'] != 'disk':
+            self.summary.setText(f"The HTTP cache is in {summary['mode']} mode, there is nothing on disk to scan")
+        else:
+            text = (
+                f"{summary['size_mb']} MB in {summary['entries']} entries from {summary['origins']} origins "
+                f"(limit {summary['max_size_mb'] or 'automatic'} MB)"
+            )
+            if summary['scheduled_prune_mb']:
+                text += f", {summary['scheduled_prune_mb']} MB pruned at the next start"
+            self.summary.setText(text)
+
+class TabOverviewDialog(QDialog):
+    """Grid of the visible tab set's tabs, drawn only from cached thumbnails
+    
+    Tabs without a thumbnail (never shown, reloaded or evicted) get a text tile,
+    so opening the overview never loads, wakes or repaints a background tab.
+    """
+    
+    COLUMNS = 4
+    
+    def __init__(self, browser, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        self.setWindowTitle("Tab Overview")
+        
+        thumbnails = browser.thumbnails
+        tab_widget = browser.tab_widget
+        tile_size = QSize(thumbnails.width, thumbnails.width * 10 // 16)
+        
+        grid_widget = QWidget()
+        grid = QGridLayout(grid_widget)
+        current_button = None
+        for i in range(tab_widget.count()):
+            widget = tab_widget.widget(i)
+            title = browser.tab_labels.titles.get(widget) or tab_widget.tabText(i)
+            button = QToolButton()
+            button.setObjectName("tabOverviewTile")
+            button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
+            button.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+            button.setIconSize(tile_size)
+            
+            pixmap = thumbnails.get(widget)
+            if pixmap is not None:
+                button.setIcon(QIcon(pixmap))
+                button.setText(title)
+            else:
+                button.setMinimumSize(tile_size)
+                button.setText(f"{title}\n{self.tab_url(widget)}")
+            if i < TabLabelModel.SHORTCUT_TABS:
+                button.setToolTip(f"Alt+{(i + 1) % 10}")
+            
+            button.clicked.connect(lambda checked, index=i: self.select(index))
+            grid.addWidget(button, i // self.COLUMNS, i % self.COLUMNS)
+            if i == tab_widget.currentIndex():
+                current_button = button
+        
+        scroll_area = QScrollArea()
+        scroll_area.setWidget(grid_widget)
+        scroll_area.setWidgetResizable(True)
+        layout = QVBoxLayout(self)
+        layout.addWidget(scroll_area)
+        self.resize(self.COLUMNS * (tile_size.width() + 24) + 48, 2 * (tile_size.height() + 48) + 48)
+        
+        # Enter opens the current tab, Tab and Shift+Tab move between tiles
+        if current_button:
+            current_button.setFocus()
+    
+    @staticmethod
+    def tab_url(widget):
+        """Return the URL of a tab without touching its page"""
+        if isinstance(widget, BrowserTab):
+            return widget.url().toString()
+        return getattr(widget, 'pending_url', '')
+    
+    def select(self, index):
+        """Switch to the chosen tab and close the overview"""
+        self.browser.activate_tab(index)
+        self.accept()
+
+class TabSwitcherDialog(QDialog):
+    """Search palette over the titles and URLs of every tab, Enter jumps to the selected match"""
+    
+    MAX_RESULTS = 50
+    
+    def __init__(self, browser, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        self.setWindowTitle("Switch Tab")
+        self.resize(600, 400)
+        
+        layout = QVBoxLayout(self)
+        self.query = QLineEdit()
+        self.query.setPlaceholderText("Search tabs by title or URL")
+        layout.addWidget(self.query)
+        self.results = QListWidget()
+        layout.addWidget(self.results)
+        
+        self.query.textChanged.connect(self.refresh)
+        self.query.returnPressed.connect(lambda: self.select(self.results.currentItem()))
+        self.results.itemActivated.connect(self.select)
+        self.refresh("")
+    
+    def refresh(self, text):
+        """List the best matches, ties in tab order"""
+        tab_sets = self.browser.tab_sets
+        matches = []
+        for order, tab_set in enumerate(tab_sets.values()):
+            for score, widget in tab_set.tab_search.search(text):
+                index = tab_set.tab_widget.indexOf(widget)
+                if index >= 0:
+                    matches.append((-score, order, index, tab_set, widget))
+        matches.sort(key=lambda match: match[:3])
+        
+        self.results.clear()
+        for _, _, index, tab_set, widget in matches[:self.MAX_RESULTS]:
+            entry = tab_set.tab_search.entries[widget]
+            prefix = f"[{tab_set.name}] " if len(tab_sets) > 1 else ""
+            item = QListWidgetItem(f"{prefix}{index + 1}. {entry['live_title'] or entry['title']}\n{entry['url']}")
+            item.setData(Qt.ItemDataRole.UserRole, (tab_set, widget))
+            self.results.addItem(item)
+        self.results.setCurrentRow(0)
+    
+    def keyPressEvent(self, event):
+        # Up and Down move through the results while the cursor stays in the search field
+        if event.key() in (Qt.Key.Key_Up, Qt.Key.Key_Down) and self.results.count():
+            step = 1 if event.key() == Qt.Key.Key_Down else -1
+            self.results.setCurrentRow(max(0, min(self.results.count() - 1, self.results.currentRow() + step)))
+            return
+        super().keyPressEvent(event)
+    
+    def select(self, item):
+        """Switch to the tab of a result and close the palette"""
+        if item is None:
+            return
+        tab_set, widget = item.data(Qt.ItemDataRole.UserRole)
+        self.browser.switch_to_widget(tab_set, widget)
+        self.accept()
+
+# Hosts file addresses that mean "blocked"
+BLOCKING_HOSTS_ADDRESSES = {'0.0.0.0', '127.0.0.1', '::', '::1'}
+# ABP rules that block a whole domain: ||example.com^ with optional type options
+ABP_DOMAIN_RULE = re.compile(r'^(@@)?\|\|([a-z0-9.-]+)\^(\$[a-z,~-]*)?$')
+HOSTNAME = re.compile(r'^[a-z0-9-]+(\.[a-z0-9-]+)+$')
+
+def parse_blocklist(lines):
+    """Parse hosts-file and ABP domain rules, return (blocked, allowed) sets of domains"""
+    blocked, allowed = set(), set()
+    for line in lines:
+        line = line.strip().lower()
+        if not line or line[0] in '#![':
+            continue
+        
+        match = ABP_DOMAIN_RULE.match(line)
+        if match:
+            (allowed if match.group(1) else blocked).add(match.group(2).strip('.'))
+            continue
+        
+        # hosts format "0.0.0.0 domain [domain ...]" or a bare domain per line
+        fields = line.split('#', 1)[0].split()
+        if fields and fields[0] in BLOCKING_HOSTS_ADDRESSES:
+            fields = fields[1:]
+        elif len(fields) != 1:
+            continue
+        blocked.update(domain for domain in fields if HOSTNAME.match(domain) and domain != 'localhost')
+    return blocked, allowed
+
+def load_block_index(list_paths, allow, index_path):
+    """Return (blocked, allowed) frozensets, compiled from the lists or read from the cached index
+
+    The index is a marshal dump keyed by the size and mtime of every list, so
+    large lists are only parsed again after they change.
+    """
+    sources = []
+    for path in list_paths:
+        path = os.path.expanduser(path)
+        try:
+            stat = os.stat(path)
+            sources.append((os.path.abspath(path), stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            log.warning("⚠️  Blocklist not found: %s", path)
+    signature = (BLOCK_INDEX_VERSION, tuple(sources), tuple(sorted(allow)))
+    
+    try:
+        with open(index_path, 'rb') as f:
+            cached_signature, blocked, allowed = marshal.load(f)
+        if cached_signature == signature:
+            return blocked, allowed
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    
+    blocked, allowed = set(), {domain.lower() for domain in allow}
+    for path, _size, _mtime in sources:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                list_blocked, list_allowed = parse_blocklist(f)
+        except OSError as e:
+            log.warning("⚠️  Could not read blocklist %s: %s", path, e)
+            continue
+        blocked |= list_blocked
+        allowed |= list_allowed
+    blocked, allowed = frozenset(blocked), frozenset(allowed)
+    
+    try:
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            marshal.dump((signature, blocked, allowed), f)
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        log.warning("⚠️  Could not write blocklist index: %s", e)
+    return blocked, allowed
+
+def domain_suffix_match(host, domains):
+    """Return True if host or one of its parent domains is in domains"""
+    while True:
+        if host in domains:
+            return True
+        dot = host.find('.')
+        if dot < 0:
+            return False
+        host = host[dot + 1:]
+
+class RequestBlocker(QWebEngineUrlRequestInterceptor):
+    """Block requests to listed domains on the profile, counting blocks per first-party host
+    
+    interceptRequest runs on Chromium's IO thread; a lookup is a handful of set
+    probes (one per host label), well below a microsecond per label.
+    """
+    
+    def __init__(self, profile_dir, settings=None, parent=None):
+        super().__init__(parent)
+        settings = {**DEFAULT_BLOCKING, **(settings or {})}
+        started = time.perf_counter()
+        self.blocked, self.allowed = load_block_index(
+            settings['lists'], settings['allow'], os.path.join(profile_dir, "blocklist.idx"))
+        self.counts = Counter()    # first-party host -> blocked requests
+        log.info("🛡️  Request blocking: %s domains loaded in %.1f ms", len(self.blocked), (time.perf_counter() - started) * 1000)
+    
+    def should_block(self, host):
+        """Return True if requests to host are blocked"""
+        return domain_suffix_match(host, self.blocked) and not domain_suffix_match(host, self.allowed)
+    
+    def interceptRequest(self, info):
+        """Block listed subresources; top-level navigations always go through"""
+        if info.resourceType() == QWebEngineUrlRequestInfo.ResourceType.ResourceTypeMainFrame:
+            return
+        host = info.requestUrl().host().lower()
+        if host and self.should_block(host):
+            info.block(True)
+            self.counts[info.firstPartyUrl().host().lower()] += 1
+    
+    def blocked_for(self, url):
+        """Return the number of requests blocked on pages of url's host"""
+        return self.counts.get(QUrl(url).host().lower(), 0)
+    
+    def stats(self):
+        """Return blocked request counts per first-party host"""
+        return dict(self.counts.most_common())
+
+class SessionStore:
+    """Navigation history and scroll position of every tab in a compact file in the profile directory
+    
+    The file is a magic header followed by a zlib-compressed QDataStream with one
+    entry per tab, keyed by the tab's configured URL from tabs.json.
+    """
+    
+    MAGIC = b"MBSESS1\n"
+    
+    def __init__(self, profile_dir):
+        self.path = os.path.join(profile_dir, "session.bin")
+        self.pending = {}    # configured URL -> list of entries not restored yet
+    
+    def load(self):
+        """Read the session file into pending entries"""
+        self.pending = {}
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+            if not data.startswith(self.MAGIC):
+                return
+            payload = QByteArray(zlib.decompress(data[len(self.MAGIC):]))
+        except (OSError, zlib.error) as e:
+            log.warning("⚠️  Could not read session file: %s", e)
+            return
+        
+        stream = QDataStream(payload, QIODevice.OpenModeFlag.ReadOnly)
+        for _ in range(stream.readUInt32()):
+            entry = {
+                'key': stream.readQString(),
+                'url': stream.readQString(),
+                'history': stream.readBytes(),
+                'scroll': (stream.readDouble(), stream.readDouble())
+            }
+            if stream.status() != QDataStream.Status.Ok:
+                break
+            self.pending.setdefault(entry['key'], []).append(entry)
+        log.info("✓ Session loaded with %s tabs from %s", sum(len(e) for e in self.pending.values()), self.path)
+    
+    def take(self, key):
+        """Return and forget the saved entry for a configured URL, or None"""
+        entries = self.pending.get(key)
+        return entries.pop(0) if entries else None
+    
+    @staticmethod
+    def capture(tab, key):
+        """Serialize a tab's history and scroll position"""
+        history = QByteArray()
+        try:
+            stream = QDataStream(history, QIODevice.OpenModeFlag.WriteOnly)
+            stream << tab.history()
+        except TypeError:
+            # No QDataStream operator for the history in this PyQt6 build: restore() falls back to the URL
+            history = QByteArray()
+        scroll = tab.page().scrollPosition()
+        return {
+            'key': key,
+            'url': tab.url().toString(),
+            'history': bytes(history),
+            'scroll': (scroll.x(), scroll.y())
+        }
+    
+    @staticmethod
+    def restore(tab, entry):
+        """Load a saved history into a fresh tab (this navigates to the saved current entry)"""
+        try:
+            stream = QDataStream(QByteArray(entry['history']), QIODevice.OpenModeFlag.ReadOnly)
+            stream >> tab.history()
+            restored = stream.status() == QDataStream.Status.Ok
+        except TypeError:
+            restored = False
+        if not restored:
+            tab.setUrl(QUrl(entry['url']))
+        
+        # Scroll once the restored page has loaded
+        x, y = entry['scroll']
+        if x or y:
+            def scroll_once(ok):
+                tab.loadFinished.disconnect(scroll_once)
+                if ok:
+                    tab.page().runJavaScript(f"window.scrollTo({x}, {y});")
+            tab.loadFinished.connect(scroll_once)
+    
+    def save(self, entries, keys):
+        """Write entries atomically, keeping saved entries of configured tabs that were never loaded
+        
+        keys are the configured URLs still in tabs.json; pending entries of removed tabs are dropped.
+        """
+        for key, remaining in self.pending.items():
+            if key in keys:
+                entries.extend(remaining)
+        
+        payload = QByteArray()
+        stream = QDataStream(payload, QIODevice.OpenModeFlag.WriteOnly)
+        stream.writeUInt32(len(entries))
+        for entry in entries:
+            stream.writeQString(entry['key'])
+            stream.writeQString(entry['url'])
+            stream.writeBytes(entry['history'])
+            stream.writeDouble(entry['scroll'][0])
+            stream.writeDouble(entry['scroll'][1])
+        
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(self.MAGIC + zlib.compress(bytes(payload)))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log.warning("⚠️  Error saving session: %s", e)
+
+class SnapshotStore(QObject):
+    """MHTML snapshots of tabs in the profile directory, capped in total size
+    
+    Snapshots are written by QWebEnginePage.save() through the profile's download
+    machinery, to a temporary file that replaces the previous snapshot once complete.
+    """
+    
+    def __init__(self, profile, storage_dir, settings=None, parent=None):
+        super().__init__(parent)
+        settings = {**DEFAULT_SNAPSHOTS, **(settings or {})}
+        self.directory = os.path.join(storage_dir, "snapshots")
+        self.max_size = int(settings['max_size_mb'] * 1024 * 1024)
+        self.max_age = settings['max_age_days'] * 86400
+        self.pending = {}    # temporary path -> final path of saves in progress
+        os.makedirs(self.directory, exist_ok=True)
+        profile.downloadRequested.connect(self.download_requested)
+    
+    def path(self, key):
+        """Return the snapshot file of a configured URL"""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directory, f"{digest}.mhtml")
+    
+    def lookup(self, key):
+        """Return (path, modification time) of a recent enough snapshot, or None"""
+        path = self.path(key)
+        try:
+            saved_at = os.path.getmtime(path)
+        except OSError:
+            return None
+        if time.time() - saved_at > self.max_age:
+            return None
+        return path, saved_at
+    
+    def save(self, tab):
+        """Start saving a snapshot of a loaded, active tab"""
+        # Only configured tabs have a key to find the snapshot by at the next start (popups don't)
+        key = getattr(tab, 'session_key', None)
+        if key is None:
+            return
+        if tab.page().lifecycleState() != QWebEnginePage.LifecycleState.Active or tab.url().scheme() not in ('http', 'https'):
+            return
+        final_path = self.path(key)
+        tmp_path = final_path + ".tmp"
+        if tmp_path in self.pending:
+            return
+        self.pending[tmp_path] = final_path
+        tab.page().save(tmp_path, QWebEngineDownloadRequest.SavePageFormat.MimeHtmlSaveFormat)
+    
+    def download_requested(self, download):
+        """Watch the downloads started by save() until they finish"""
+        if not download.isSavePageDownload():
+            return
+        tmp_path = os.path.join(download.downloadDirectory(), download.downloadFileName())
+        if tmp_path not in self.pending:
+            return
+        download.isFinishedChanged.connect(lambda d=download, p=tmp_path: self.save_finished(d, p))
+    
+    def save_finished(self, download, tmp_path):
+        """Move a completed snapshot into place and keep the store within its size cap"""
+        final_path = self.pending.pop(tmp_path, None)
+        if final_path is None:
+            return
+        try:
+            if download.state() == QWebEngineDownloadRequest.DownloadState.DownloadCompleted:
+                os.replace(tmp_path, final_path)
+                log.debug("📸 Snapshot saved: %s", download.url().toString())
+            else:
+                os.remove(tmp_path)
+        except OSError as e:
+            log.warning("⚠️  Error saving snapshot: %s", e)
+        self.prune()
+    
+    def prune(self):
+        """Delete the least recently saved snapshots until the store fits max_size_mb"""
+        snapshots = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".mhtml"):
+                stat = entry.stat()
+                snapshots.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in snapshots)
+        for _, size, path in sorted(snapshots):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+class SnapshotView(QWidget):
+    """A tab's saved snapshot, shown with a stale banner until the live page has loaded"""
+    
+    def __init__(self, path, saved_at, live_tab, parent=None):
+        super().__init__(parent)
+        # Stands in for the live tab towards tab labels, usage stats and telemetry
+        self.live_tab = live_tab
+        self.tab_config = live_tab.tab_config
+        self.session_key = live_tab.session_key
         
-        # Set up permission handling for microphone and camera access
-        self.setup_permission_handling()
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        banner = QLabel(f"🕰️ Saved snapshot from {time.strftime('%Y-%m-%d %H:%M', time.localtime(saved_at))} - loading the live page...")
+        banner.setObjectName("staleBanner")
+        banner.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(banner)
         
-        # Set up popup window handling
-        self.setup_popup_handling()
+        # MHTML is rendered without running scripts, so the snapshot is cheap to show
+        self.view = QWebEngineView(live_tab.page().profile(), self)
+        self.view.setUrl(QUrl.fromLocalFile(path))
+        layout.addWidget(self.view)
+
+class ThemeEngine(QObject):
+    """Load QSS themes from themes/, cache compiled stylesheets by mtime and hot reload them"""
     
-    def setup_permission_handling(self):
-        """Set up permission handling for microphone, camera, and other features"""
-        # Connect the feature permission requested signal
-        self.page().featurePermissionRequested.connect(self.handle_feature_permission_request)
+    def __init__(self, target, themes_dir=THEMES_DIR):
+        super().__init__(target)
+        self.target = target
+        self.themes_dir = themes_dir
+        self.cache = {}           # path -> (mtime, compiled stylesheet)
+        self.current_theme = None
+        self.applied = None
         
-        # Also connect the general permission requested signal for broader compatibility
-        self.page().permissionRequested.connect(self.handle_permission_request)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.theme_file_changed)
         
-        print("✓ Permission handling set up for microphone, camera, and other features")
+        # Editors save in bursts, so re-apply once things are quiet
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(100)
+        self.reload_timer.timeout.connect(lambda: self.apply(self.current_theme))
     
-    def handle_feature_permission_request(self, security_origin, feature):
-        """Handle feature permission requests (microphone, camera, etc.)"""
-        # Automatically grant permissions for media devices (microphone, camera)
-        if feature in [
-            QWebEnginePage.Feature.MediaAudioCapture,
-            QWebEnginePage.Feature.MediaVideoCapture,
-            QWebEnginePage.Feature.MediaAudioVideoCapture,
-            QWebEnginePage.Feature.DesktopAudioVideoCapture,
-            QWebEnginePage.Feature.DesktopVideoCapture
-        ]:
-            # Grant the permission
-            self.page().setFeaturePermission(
-                security_origin, 
-                feature, 
-                QWebEnginePage.PermissionPolicy.PermissionGrantedByUser
+    def theme_path(self, name):
+        """Return the stylesheet path of a theme"""
+        return os.path.join(self.themes_dir, f"{name}.css")
+    
+    def compile(self, name):
+        """Return the stylesheet of a theme with its variables filled in, cached by file mtime"""
+        path = self.theme_path(name)
+        mtime = os.stat(path).st_mtime
+        cached = self.cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        with open(path, 'r') as f:
+            stylesheet = Template(f.read()).safe_substitute(
+                font_family=resolve_font_family(),
+                font_size=TAB_FONT_SIZE
             )
-            print(f"🎤 Permission granted for {feature} from {security_origin.host()}")
+        self.cache[path] = (mtime, stylesheet)
+        return stylesheet
+    
+    def apply(self, name):
+        """Apply a theme, falling back to the dark theme if it doesn't exist"""
+        if not os.path.exists(self.theme_path(name)):
+            log.warning("⚠️  Theme '%s' not found in %s, using dark", name, self.themes_dir)
+            name = "dark"
+        try:
+            stylesheet = self.compile(name)
+        except OSError as e:
+            log.warning("⚠️  Error loading theme '%s': %s", name, e)
             return
         
-        # For other features, use the default behavior (ask user or deny)
-        print(f"❓ Feature permission requested: {feature} from {security_origin.host()}")
+        path = self.theme_path(name)
+        if path not in self.watcher.files():
+            self.watcher.addPath(path)
+        self.current_theme = name
+        
+        # setStyleSheet re-polishes every widget, so skip it when nothing changed
+        if stylesheet == self.applied:
+            return
+        self.target.setStyleSheet(stylesheet)
+        self.applied = stylesheet
+        log.info("✓ Theme '%s' applied from %s", name, path)
     
-    def handle_permission_request(self, security_origin, permission):
-        """Handle general permission requests"""
-        # For now, we'll just log these requests
-        print(f"🔐 Permission requested: {permission} from {security_origin.host()}")
+    def theme_file_changed(self, path):
+        """Re-apply the current theme when its file changes"""
+        # Editors that replace the file drop it from the watcher
+        if os.path.exists(path) and path not in self.watcher.files():
+            self.watcher.addPath(path)
+        if path == self.theme_path(self.current_theme):
+            self.reload_timer.start()
+
+class SingleInstanceServer(QObject):
+    """Accept the arguments of later launches and hand them to the running browser"""
     
-    def setup_popup_handling(self):
-        """Set up handling for popup windows"""
-        # Connect the signal for when a new window is requested
-        self.page().createWindow = self.handle_create_window
-        print("✓ Popup window handling set up")
+    def __init__(self, socket_path, handler, parent=None):
+        super().__init__(parent)
+        self.handler = handler
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        
+        # Remove a stale socket left behind by a crashed instance
+        QLocalServer.removeServer(socket_path)
+        if self.server.listen(socket_path):
+            log.info("✓ Single-instance server listening on %s", socket_path)
+        else:
+            log.warning("⚠️  Could not start single-instance server: %s", self.server.errorString())
+        
+        self.server.newConnection.connect(self.accept_connections)
     
-    def handle_create_window(self, window_type):
-        """Handle creation of new windows (popups)"""
-        # Create a new BrowserTab for the popup
-        popup_tab = BrowserTab(profile=self.page().profile())
+    def accept_connections(self):
+        """Read the message of every pending connection"""
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.disconnected.connect(connection.deleteLater)
+            connection.readyRead.connect(lambda c=connection: self.read_message(c))
+    
+    def read_message(self, connection):
+        """Parse one JSON line, acknowledge it and pass the arguments on"""
+        if not connection.canReadLine():
+            return
+        
+        line = bytes(connection.readLine()).decode('utf-8', errors='replace')
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            connection.write(b"error\n")
+            connection.disconnectFromServer()
+            return
         
-        # Connect the URL changed signal to update the popup content
-        popup_tab.page().urlChanged.connect(lambda url: print(f"🌐 Popup window URL changed: {url}"))
+        # Answer first so the launching process can exit right away
+        connection.write(b"ok\n")
+        connection.flush()
+        connection.disconnectFromServer()
         
-        print(f"🪟 New window created (type: {window_type})")
-        return popup_tab
+        argv = message.get('argv', [])
+        cwd = message.get('cwd')
+        QTimer.singleShot(0, lambda: self.handler(argv, cwd))
+    
+    def close(self):
+        """Stop listening and remove the socket file"""
+        self.server.close()
+
+def resolve_tab_sets(config, config_file, profile_dir):
+    """Return (name, tabs.json path, storage directory) for every tab set
+
+    Without a "tab_sets" section there is a single set using --config and the
+    original profile directory.
+    """
+    tab_sets = config.get('tab_sets') or {}
+    if not tab_sets:
+        return [(DEFAULT_TAB_SET, config_file, profile_dir)]
+    
+    result = []
+    for name, entry in tab_sets.items():
+        set_config_file = os.path.expanduser(entry.get('config', config_file))
+        storage = entry.get('storage')
+        storage_dir = os.path.expanduser(storage) if storage else os.path.join(profile_dir, "sets", name)
+        result.append((name, set_config_file, storage_dir))
+    return result
+
+class TabSet(QObject):
+    """A named group of tabs with its own tabs.json, web profile, HTTP cache and storage path"""
+    
+    def __init__(self, name, config_file, storage_dir, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.config_file = config_file
+        self.storage_dir = storage_dir
+        self.tabs_config = []
+        
+        # Set up by MultiBrowser.setup_persistent_profile and watch_tabs_config
+        self.profile = None
+        self.http_cache = None
+        self.popups = None
+        self.session = None
+        self.snapshots = None
+        self.tabs_config_path = None
+        self.tabs_watcher = None
+        self.tabs_reload_timer = None
+        
+        # Tab widget - removed closable and movable features
+        self.tab_widget = QTabWidget()
+        self.tab_widget.setTabsClosable(False)  # Disable close buttons
+        self.tab_widget.setMovable(False)  # Disable tab reordering
+        self.tab_labels = TabLabelModel(self.tab_widget, self)
+        self.tab_search = TabSearchIndex(self.tab_widget)
 
 class MultiBrowser(QMainWindow):
-    def __init__(self, config_file="tabs.json", window_class=None, theme=None, dark_mode=None, config=None):
+    # currentChanged of the visible tab set's tab widget (background sets don't emit it)
+    current_tab_changed = pyqtSignal(int)
+    
+    def __init__(self, config_file="tabs.json", window_class=None, theme=None, dark_mode=None, config=None, lazy_tabs=None, single_instance=False, profile_dir=None, restore_session=None, tab_set=None):
         super().__init__()
         
+        # Portable profile next to main.py unless another location is given (e.g. by benchmark.py)
+        self.profile_dir = profile_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".profile")
+        
+        # In single-instance mode closing only hides the window so the engine stays warm
+        self.single_instance = single_instance
+        self.quitting = False
+        
         # Store configuration
         self.config = config or {}
         self.config_file = config_file
         
-        # Set up persistent profile for cookies
-        self.setup_persistent_profile()
+        # Opt-in: restore each tab's navigation history and scroll position from the last run
+        if restore_session is None:
+            restore_session = self.config.get('restore_session', DEFAULT_RESTORE_SESSION)
+        self.restore_session = restore_session
+        
+        # Zoom factors per origin, applied from urlChanged on every navigation
+        self.zoom_index = ZoomIndex(self.config)
+        
+        # Follow changes other MultiBrowser instances write to multibrowser.json
+        config_store.listeners.append(self.zoom_index.reload)
+        self.config_watcher = QFileSystemWatcher(self)
+        self.config_watcher.addPath(DEFAULT_CONFIG_DIR)
+        if os.path.exists(DEFAULT_CONFIG_FILE):
+            self.config_watcher.addPath(DEFAULT_CONFIG_FILE)
+        self.config_watcher.fileChanged.connect(self.reload_persistent_config)
+        self.config_watcher.directoryChanged.connect(self.reload_persistent_config)
+        
+        # In lazy mode only the active tab and tabs marked "eager" get a web view at startup
+        if lazy_tabs is None:
+            lazy_tabs = self.config.get('lazy_tabs', DEFAULT_LAZY_TABS)
+        self.lazy_tabs = lazy_tabs
+        
+        # Optional tracker/ad blocking, one compiled index shared by every profile
+        self.request_blocker = None
+        blocking_settings = {**DEFAULT_BLOCKING, **self.config.get('blocking', {})}
+        if blocking_settings['enabled']:
+            self.request_blocker = RequestBlocker(self.profile_dir, blocking_settings, self)
+        
+        # Tab sets (e.g. work and personal) share this engine but each has its own
+        # persistent profile, so cookies and cache stay separate
+        self.tab_sets = {}
+        with startup_tracer.phase('setup_persistent_profile'):
+            for name, set_config_file, storage_dir in resolve_tab_sets(self.config, config_file, self.profile_dir):
+                self.tab_sets[name] = TabSet(name, set_config_file, storage_dir, self)
+                self.setup_persistent_profile(self.tab_sets[name])
+        initial_set = tab_set or self.config.get('default_tab_set')
+        if initial_set not in self.tab_sets:
+            if initial_set:
+                log.warning("⚠️  Unknown tab set '%s'", initial_set)
+            initial_set = next(iter(self.tab_sets))
+        self.tab_set = self.tab_sets[initial_set]
         
         # Set window class if provided
         if window_class:
@@ -229,317 +3111,532 @@ class MultiBrowser(QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         
-        # Tab widget - removed closable and movable features
-        self.tab_widget = QTabWidget()
-        self.tab_widget.setTabsClosable(False)  # Disable close buttons
-        self.tab_widget.setMovable(False)  # Disable tab reordering
+        # One tab widget per tab set, only the current set's is shown
+        self.tab_stack = QStackedWidget()
+        for each_set in self.tab_sets.values():
+            self.tab_stack.addWidget(each_set.tab_widget)
+        self.tab_stack.setCurrentWidget(self.tab_widget)
         
         # Apply styling - use theme from config if available, otherwise use provided theme
         effective_theme = theme or self.config.get('theme', DEFAULT_THEME)
-        self.apply_theme(effective_theme)
+        self.theme_engine = ThemeEngine(self)
+        with startup_tracer.phase('apply_theme', theme=effective_theme):
+            self.apply_theme(effective_theme)
         
-        # Add hamburger menu to tab bar
-        self.setup_hamburger_menu()
+        # Add hamburger menu to the tab bar of every set
+        for each_set in self.tab_sets.values():
+            self.setup_hamburger_menu(each_set)
         
-        layout.addWidget(self.tab_widget)
+        layout.addWidget(self.tab_stack)
         self.setCentralWidget(central_widget)
         
         # Set up keyboard shortcuts using QShortcut
-        self.setup_keyboard_shortcuts()
+        with startup_tracer.phase('setup_keyboard_shortcuts'):
+            self.setup_keyboard_shortcuts()
+        
+        # Screenshots for the tab overview, taken as the user leaves a tab
+        self.thumbnails = ThumbnailCache(self.config.get('thumbnails'))
+        
+        # Opt-in: show saved page snapshots right away while the live pages load
+        snapshot_settings = {**DEFAULT_SNAPSHOTS, **self.config.get('snapshots', {})}
+        
+        for each_set in self.tab_sets.values():
+            # Opt-in: restore each tab's navigation history and scroll position from the last run
+            if self.restore_session:
+                each_set.session = SessionStore(each_set.storage_dir)
+                each_set.session.load()
+            
+            if snapshot_settings['enabled']:
+                each_set.snapshots = SnapshotStore(each_set.profile, each_set.storage_dir, snapshot_settings, each_set)
+            
+            # Load tabs from config
+            with startup_tracer.phase('load_tabs_from_config', tab_set=each_set.name):
+                self.load_tabs_from_config(each_set)
+            
+            # Reconcile the open tabs whenever tabs.json changes on disk
+            self.watch_tabs_config(each_set)
+            
+            # Only the visible set's tab switches concern lazy loading, hibernation and lifecycle
+            each_set.tab_widget.currentChanged.connect(
+                lambda index, s=each_set: self.current_tab_changed.emit(index) if s is self.tab_set else None)
+            
+            # A click on the tab bar arrives while the tab being left is still visible
+            each_set.tab_widget.tabBarClicked.connect(
+                lambda index, s=each_set: self.thumbnails.capture(s.tab_widget.currentWidget()))
+        
+        # Create the web view of a lazy tab the first time it is activated
+        self.current_tab_changed.connect(self.ensure_tab_loaded)
+        self.ensure_tab_loaded(self.tab_widget.currentIndex())
+        
+        # Discard least recently used background tabs when over the memory budget
+        self.hibernation = None
+        hibernation_settings = {**DEFAULT_HIBERNATION, **self.config.get('hibernation', {})}
+        if hibernation_settings['enabled']:
+            self.hibernation = TabHibernationManager(self, hibernation_settings)
+            self.current_tab_changed.connect(self.hibernation.tab_activated)
+            self.hibernation.tab_activated(self.tab_widget.currentIndex())
+        
+        # Freeze background tabs (timers, animations, websockets) after an idle period
+        self.lifecycle = None
+        lifecycle_settings = {**DEFAULT_LIFECYCLE, **self.config.get('lifecycle', {})}
+        if lifecycle_settings['enabled']:
+            self.lifecycle = TabLifecycleScheduler(self, lifecycle_settings)
+            self.current_tab_changed.connect(self.lifecycle.tab_activated)
+            self.lifecycle.tab_activated(self.tab_widget.currentIndex())
         
-        # Load tabs from config
-        self.load_tabs_from_config(config_file)
+        # Reloads go through one scheduler so bulk reloads don't start every tab at once
+        self.reloads = ReloadScheduler(self, self.config.get('reload'))
+        self.current_tab_changed.connect(self.reloads.tab_activated)
         
-        # Connect tab change signal to restore zoom
-        self.tab_widget.currentChanged.connect(self.restore_tab_zoom)
+        # Keep the tabs most likely to be used next loaded, based on switch history
+        self.prewarm = None
+        prewarm_settings = {**DEFAULT_PREWARM, **self.config.get('prewarm', {})}
+        if prewarm_settings['enabled']:
+            self.prewarm = TabPrewarmScheduler(self, self.profile_dir, prewarm_settings)
+            for each_set in self.tab_sets.values():
+                each_set.tab_widget.tabBarClicked.connect(self.prewarm.record_switch)
+            # After the switch has settled, so the new tab's neighbours are predicted
+            self.current_tab_changed.connect(lambda index: QTimer.singleShot(0, self.prewarm.prewarm))
+            QTimer.singleShot(0, self.prewarm.prewarm)
         
-        # Restore zoom for all tabs after a small delay to ensure pages are loaded
-        def delayed_zoom_restore():
-            time.sleep(2)  # Wait 2 seconds for pages to start loading
-            for i in range(self.tab_widget.count()):
-                self.restore_tab_zoom(i)
+        # Renderer PID, RSS, PSS and CPU per tab for the Task Manager and --dump-stats
+        self.telemetry = TabTelemetry(self)
         
-        # Start the delayed zoom restore in a separate thread
-        threading.Thread(target=delayed_zoom_restore, daemon=True).start()
+        # Save the session on exit and periodically (in case the process gets killed)
+        if self.restore_session:
+            QApplication.instance().aboutToQuit.connect(self.save_session)
+            self.session_timer = QTimer(self)
+            self.session_timer.timeout.connect(self.save_session)
+            self.session_timer.start(SESSION_SAVE_INTERVAL_S * 1000)
+        
+        # page.save() finishes asynchronously, after the event loop has stopped on exit,
+        # so snapshots are only saved periodically
+        if snapshot_settings['enabled']:
+            self.snapshot_timer = QTimer(self)
+            self.snapshot_timer.timeout.connect(self.save_snapshots)
+            self.snapshot_timer.start(int(snapshot_settings['save_interval_s'] * 1000))
+    
+    # The rest of the browser works on the visible tab set through these
+    @property
+    def tab_widget(self):
+        return self.tab_set.tab_widget
+    
+    @property
+    def tab_labels(self):
+        return self.tab_set.tab_labels
+    
+    @property
+    def tabs_config(self):
+        return self.tab_set.tabs_config
     
-    def setup_persistent_profile(self):
-        """Set up persistent profile for cookies and session data in portable .profile directory"""
-        # Use application directory for portable profile
-        app_dir = os.path.dirname(os.path.abspath(__file__))
-        profile_dir = os.path.join(app_dir, ".profile")
+    @property
+    def profile(self):
+        return self.tab_set.profile
+    
+    @property
+    def http_cache(self):
+        return self.tab_set.http_cache
+    
+    @property
+    def popups(self):
+        return self.tab_set.popups
+    
+    def setup_persistent_profile(self, tab_set):
+        """Set up persistent profile for cookies and session data in the tab set's storage directory"""
+        profile_dir = tab_set.storage_dir
         
         # Create profile directory if it doesn't exist
         os.makedirs(profile_dir, exist_ok=True)
         
-        # Set up persistent profile
-        self.profile = QWebEngineProfile("MultiBrowser", self)
-        self.profile.setPersistentStoragePath(profile_dir)
-        self.profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.AllowPersistentCookies)
+        # Set up persistent profile - the implicit single set keeps the original profile name
+        profile_name = "MultiBrowser" if tab_set.name == DEFAULT_TAB_SET else f"MultiBrowser-{tab_set.name}"
+        tab_set.profile = QWebEngineProfile(profile_name, self)
+        tab_set.profile.setPersistentStoragePath(profile_dir)
+        tab_set.profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.AllowPersistentCookies)
+        apply_profile_web_settings(tab_set.profile)
+        
+        # Configure HTTP cache from the "cache" policy in multibrowser.json
+        tab_set.http_cache = HttpCacheManager(tab_set.profile, profile_dir, self.config.get('cache'), self)
         
-        # Configure HTTP cache
-        cache_path = os.path.join(profile_dir, "cache")
-        self.profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
-        self.profile.setHttpCacheMaximumSize(100 * 1024 * 1024)  # 100MB cache
-        self.profile.setCachePath(cache_path)
+        if self.request_blocker:
+            tab_set.profile.setUrlRequestInterceptor(self.request_blocker)
         
-        print(f"Persistent profile set up at: {profile_dir}")
-        print("✓ Cookies and session data will persist across sessions")
-        print("✓ Profile is portable (stored in application directory)")
+        # Popups opened by pages become parented windows or tabs with a bounded lifetime
+        tab_set.popups = PopupManager(self, tab_set, self.config.get('popups'))
+        
+        log.info("Persistent profile '%s' set up at: %s", profile_name, profile_dir)
+        log.info("✓ Cookies and session data will persist across sessions")
+        log.info("✓ Profile is portable (stored in application directory)")
     
     def apply_theme(self, theme_name):
         """Apply CSS theme to the application"""
-        # Load FiraCode Nerd Font
-        self.load_nerd_font()
-        
-        # Apply theme-specific styling
-        if theme_name == "dark":
-            self.apply_dark_theme()
-        elif theme_name == "tokyo-night":
-            self.apply_tokyo_night_theme()
-        else:
-            # Default to dark theme
-            self.apply_dark_theme()
-    
-    def load_nerd_font(self):
-        """Load FiraCode Nerd Font for tabs"""
-        try:
-            # Try to load FiraCode Nerd Font
-            font_id = QFontDatabase.addApplicationFont("FiraCode Nerd Font Complete.ttf")
-            if font_id != -1:
-                font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-                font = QFont(font_family, 24)
-                
-                # Apply to tab bar
-                tab_bar = self.tab_widget.tabBar()
-                tab_bar.setFont(font)
-                tab_bar.setStyleSheet("""
-                    QTabBar {
-                        font-family: '" + font_family + "';
-                        font-size: 24px;
-                    }
-                """)
-                print(f"✓ FiraCode Nerd Font loaded: {font_family}")
-            else:
-                print("⚠️  FiraCode Nerd Font not found, using fallback")
-                self.apply_fallback_font()
-        except Exception as e:
-            print(f"⚠️  Error loading FiraCode Nerd Font: {e}")
-            self.apply_fallback_font()
-    
-    def apply_fallback_font(self):
-        """Apply fallback font styling"""
-        tab_bar = self.tab_widget.tabBar()
-        font = QFont("Monospace", 24)
-        tab_bar.setFont(font)
-        tab_bar.setStyleSheet("""
-            QTabBar {
-                font-family: 'Monospace';
-                font-size: 24px;
-            }
-        """)
-    
-    def apply_dark_theme(self):
-        """Apply dark theme styling with separate styles for shortcut and title"""
-        # Define common base style
-        base_font_family = "'FiraCode Nerd Font', monospace"
-        base_font_size = "24px"
-        
-        # Apply theme with separate colors for shortcut and title
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }}
-            
-            QTabWidget::pane {{
-                border: 1px solid #333333;
-                background-color: #252526;
-            }}
-            
-            QTabBar::tab {{
-                background-color: #252526;
-                color: #ffffff;
-                padding: 8px 16px;
-                border: 1px solid #333333;
-                border-bottom: none;
-                min-width: 120px;
-                font-family: {base_font_family};
-                font-size: {base_font_size};
-            }}
-            
-            QTabBar::tab:selected {{
-                background-color: #0078d7;
-                color: #ffffff;
-                border-color: #0078d7;
-            }}
-            
-            QTabBar::tab:hover {{
-                background-color: #2d2d30;
-            }}
-            
-            /* Style for keyboard shortcut part - lighter color for contrast */
-            .shortcut {{
-                color: #a8a8a8;  /* Lighter gray for shortcut */
-            }}
-            
-            /* Style for title part - brighter color for emphasis */
-            .title {{
-                color: #ffffff;  /* White for title */
-            }}
-            
-            /* Style for hamburger menu button - visible and aligned */
-            QToolButton {{
-                font-size: 24px;
-                padding: 0px 10px;
-                border: none;
-                background-color: transparent;
-                color: #ffffff;  /* White for visibility */
-            }}
-            
-            QToolButton:hover {{
-                background-color: rgba(255, 255, 255, 0.1);
-            }}
-        """)
-        
-        print("✓ Dark theme applied with separate shortcut/title styling")
-    
-    def apply_tokyo_night_theme(self):
-        """Apply Tokyo Night theme styling with separate styles for shortcut and title"""
-        # Define common base style
-        base_font_family = "'FiraCode Nerd Font', monospace"
-        base_font_size = "24px"
-        
-        # Apply theme with separate colors for shortcut and title
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: #1a1b26;
-                color: #c0caf5;
-            }}
-            
-            QTabWidget::pane {{
-                border: 1px solid #16161e;
-                background-color: #16161e;
-            }}
-            
-            QTabBar::tab {{
-                background-color: #16161e;
-                color: #7aa2f7;
-                padding: 8px 16px;
-                border: 1px solid #16161e;
-                border-bottom: none;
-                min-width: 120px;
-                font-family: {base_font_family};
-                font-size: {base_font_size};
-            }}
-            
-            QTabBar::tab:selected {{
-                background-color: #7aa2f7;
-                color: #16161e;
-                border-color: #7aa2f7;
-            }}
-            
-            QTabBar::tab:hover {{
-                background-color: #1e1e2e;
-                color: #7aa2f7;
-            }}
-            
-            /* Style for keyboard shortcut part - lighter blue for contrast */
-            .shortcut {{
-                color: #9aa5ff;  /* Lighter blue for shortcut */
-            }}
-            
-            /* Style for title part - brighter blue for emphasis */
-            .title {{
-                color: #7aa2f7;  /* Bright blue for title */
-            }}
-            
-            /* Style for hamburger menu button - visible and aligned */
-            QToolButton {{
-                font-size: 24px;
-                padding: 0px 10px;
-                border: none;
-                background-color: transparent;
-                color: #7aa2f7;  /* Bright blue for visibility */
-            }}
-            
-            QToolButton:hover {{
-                background-color: rgba(7aa2f7, 0.1);
-            }}
-        """)
+        # Resolve FiraCode Nerd Font (memoized, so only the first call asks the font database)
+        with startup_tracer.phase('load_nerd_font'):
+            self.apply_tab_font()
         
-        print("✓ Tokyo Night theme applied with separate shortcut/title styling")
+        # Stylesheets come from themes/<name>.css and are cached until the file changes
+        self.theme_engine.apply(theme_name)
     
-    def load_tabs_from_config(self, config_file):
+    def apply_tab_font(self):
+        """Apply the resolved tab font to the tab bar of every set"""
+        family = resolve_font_family()
+        for tab_set in self.tab_sets.values():
+            tab_bar = tab_set.tab_widget.tabBar()
+            if tab_bar.font().family() != family:
+                tab_bar.setFont(QFont(family, TAB_FONT_SIZE))
+    
+    def load_tabs_from_config(self, tab_set):
+        config_file = tab_set.config_file
+        # Only the visible set loads its first tab right away
+        visible = tab_set is self.tab_set
         try:
             with open(config_file, 'r') as f:
-                self.tabs_config = json.load(f)
+                tab_set.tabs_config = json.load(f)
                 
-            for tab_config in self.tabs_config:
+            for index, tab_config in enumerate(tab_set.tabs_config):
                 title = tab_config.get('title', 'New Tab')
                 url = tab_config.get('url', 'about:blank')
-                self.add_tab_with_url(title, url)
+                # The first tab is the active one, so it always loads right away
+                eager = not self.lazy_tabs or (visible and index == 0) or tab_config.get('eager', False)
+                self.add_tab_with_url(title, url, lazy=not eager, tab_config=tab_config, tab_set=tab_set)
+            
+            if self.lazy_tabs:
+                log.info("💤 Lazy tabs enabled: %s tabs in set '%s', web views created on first activation",
+                         tab_set.tab_widget.count(), tab_set.name)
                 
         except FileNotFoundError:
-            print(f"Config file {config_file} not found, starting with default tab")
-            self.tabs_config = [{'title': 'Home', 'url': 'about:blank'}]
-            self.add_tab_with_url("Home", "about:blank")
+            log.warning("Config file %s not found, starting with default tab", config_file)
+            tab_set.tabs_config = [{'title': 'Home', 'url': 'about:blank'}]
+            self.add_tab_with_url("Home", "about:blank", tab_set=tab_set)
         except json.JSONDecodeError:
-            print(f"Error parsing {config_file}, starting with default tab")
-            self.tabs_config = [{'title': 'Home', 'url': 'about:blank'}]
-            self.add_tab_with_url("Home", "about:blank")
+            log.warning("Error parsing %s, starting with default tab", config_file)
+            tab_set.tabs_config = [{'title': 'Home', 'url': 'about:blank'}]
+            self.add_tab_with_url("Home", "about:blank", tab_set=tab_set)
         except Exception as e:
-            print(f"Error loading config: {e}, starting with default tab")
-            self.tabs_config = [{'title': 'Home', 'url': 'about:blank'}]
-            self.add_tab_with_url("Home", "about:blank")
-    
-    def add_tab_with_url(self, title, url):
-        # Use persistent profile for all tabs
-        tab = BrowserTab(url, profile=self.profile)
-        index = self.tab_widget.addTab(tab, title)
-        
-        # Add keyboard shortcut indicator for first 10 tabs
-        self.update_tab_title_with_shortcut(index, title)
-        
-        # Connect signals for URL and title changes
-        tab.urlChanged.connect(lambda url, i=index: self.update_tab_title(i, url))
-        if hasattr(tab, 'titleChanged'):
-            tab.titleChanged.connect(lambda title, i=index: self.update_tab_title_from_title(i, title))
-        elif hasattr(tab, 'page') and hasattr(tab.page(), 'titleChanged'):
-            tab.page().titleChanged.connect(lambda title, i=index: self.update_tab_title_from_title(i, title))
-        
-        # Also connect loadFinished signal to restore zoom after page loads
-        if hasattr(tab, 'loadFinished'):
-            tab.loadFinished.connect(lambda success, i=index: self.restore_tab_zoom_after_load(i))
-        elif hasattr(tab, 'page') and hasattr(tab.page(), 'loadFinished'):
-            tab.page().loadFinished.connect(lambda success, i=index: self.restore_tab_zoom_after_load(i))
-    
-    def update_tab_title_with_shortcut(self, index, title):
-        """Update tab title with keyboard shortcut indicator for first 10 tabs"""
-        if index < 10:
-            # Use standard Alt+n notation with styling
-            shortcut_text = f"(Alt+{index + 1}) {title}"
-            self.tab_widget.setTabText(index, shortcut_text)
-        else:
-            self.tab_widget.setTabText(index, title)
-    
-    def update_tab_title_from_title(self, index, title):
-        """Update tab title when page title changes - but always use original title from tabs.json"""
-        if index >= 0 and index < self.tab_widget.count():
-            # Always use the original title from tabs.json, never let website override it
-            if index < len(self.tabs_config):
-                original_title = self.tabs_config[index].get('title', 'Untitled')
+            log.warning("Error loading config: %s, starting with default tab", e)
+            tab_set.tabs_config = [{'title': 'Home', 'url': 'about:blank'}]
+            self.add_tab_with_url("Home", "about:blank", tab_set=tab_set)
+    
+    def watch_tabs_config(self, tab_set):
+        """Watch a set's tabs.json (and its directory, for files that are replaced or created later)"""
+        tab_set.tabs_config_path = os.path.abspath(tab_set.config_file)
+        tab_set.tabs_watcher = QFileSystemWatcher(tab_set)
+        tab_set.tabs_watcher.addPath(os.path.dirname(tab_set.tabs_config_path))
+        if os.path.exists(tab_set.tabs_config_path):
+            tab_set.tabs_watcher.addPath(tab_set.tabs_config_path)
+        
+        # cp and editors produce several change events per save
+        tab_set.tabs_reload_timer = QTimer(tab_set)
+        tab_set.tabs_reload_timer.setSingleShot(True)
+        tab_set.tabs_reload_timer.setInterval(200)
+        tab_set.tabs_reload_timer.timeout.connect(lambda: self.reload_tabs_config(tab_set))
+        tab_set.tabs_watcher.fileChanged.connect(lambda path: tab_set.tabs_reload_timer.start())
+        tab_set.tabs_watcher.directoryChanged.connect(lambda path: tab_set.tabs_reload_timer.start())
+    
+    def reload_tabs_config(self, tab_set):
+        """Re-read a set's tabs.json and reconcile its open tabs against it"""
+        path = tab_set.tabs_config_path
+        if os.path.exists(path) and path not in tab_set.tabs_watcher.files():
+            tab_set.tabs_watcher.addPath(path)
+        
+        try:
+            with open(path, 'r') as f:
+                new_config = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            # Missing or half-written file - keep the current tabs
+            log.warning("⚠️  Not reloading %s: %s", path, e)
+            return
+        
+        if not isinstance(new_config, list) or not new_config or new_config == tab_set.tabs_config:
+            return
+        self.reconcile_tabs(new_config, tab_set)
+    
+    def reconcile_tabs(self, new_config, tab_set=None):
+        """Keep tabs whose URL is unchanged, move reordered ones, create added and destroy removed tabs"""
+        tab_set = tab_set or self.tab_set
+        tab_widget = tab_set.tab_widget
+        tab_labels = tab_set.tab_labels
+        start = time.monotonic()
+        current_widget = tab_widget.currentWidget()
+        current_index = tab_widget.currentIndex()
+        
+        # Pool the existing page widgets by configured URL (a URL listed twice keeps both);
+        # popup tabs have no tabs.json entry and stay where they are, after the configured tabs
+        pool = {}
+        configured = [tab_widget.widget(i) for i in range(tab_widget.count())
+                      if not getattr(tab_widget.widget(i), 'popup', False)]
+        for i, widget in enumerate(configured):
+            url = tab_set.tabs_config[i].get('url', 'about:blank') if i < len(tab_set.tabs_config) else None
+            pool.setdefault(url, []).append(widget)
+        
+        widgets = []
+        created = []
+        for tab_config in new_config:
+            url = tab_config.get('url', 'about:blank')
+            if pool.get(url):
+                widget = pool[url].pop(0)
+            elif self.lazy_tabs and not tab_config.get('eager', False):
+                widget = LazyTabPlaceholder(tab_config.get('title', 'New Tab'), url, tab_config)
+                created.append(widget)
             else:
-                original_title = 'Untitled'
+                widget = self.create_browser_tab(url, tab_config, tab_set)
+                created.append(widget)
+            widget.tab_config = tab_config
+            widgets.append(widget)
+        removed = [widget for remaining in pool.values() for widget in remaining]
+        
+        moved = 0
+        tab_widget.blockSignals(True)
+        try:
+            for widget in removed:
+                tab_widget.removeTab(tab_widget.indexOf(widget))
+                tab_labels.forget(widget)
+                tab_set.tab_search.forget(widget)
+                self.forget_tab(widget)
+                widget.deleteLater()
             
-            # Truncate if too long
-            if len(original_title) > 25:  # Reduced to make room for shortcut
-                original_title = original_title[:22] + "..."
+            for position, widget in enumerate(widgets):
+                index = tab_widget.indexOf(widget)
+                if index == -1:
+                    tab_widget.insertTab(position, widget, "")
+                elif index != position:
+                    # Moving through the tab bar keeps the live view and its page
+                    tab_widget.tabBar().moveTab(index, position)
+                    moved += 1
             
-            # Re-add shortcut indicator if it's one of the first 10 tabs
-            if index < 10:
-                original_title = f"(Alt+{index + 1}) {original_title}"
+            tab_set.tabs_config = new_config
+            for widget, tab_config in zip(widgets, new_config):
+                tab_labels.set_title(widget, tab_config.get('title', 'New Tab'))
+                tab_set.tab_search.set_entry(widget, tab_config.get('title', 'New Tab'), tab_config.get('url', 'about:blank'))
+            # Moved tabs changed their shortcut indicator, update every label now
+            tab_labels.mark_all_dirty()
+            tab_labels.flush()
             
-            self.tab_widget.setTabText(index, original_title)
+            if current_widget in removed:
+                tab_widget.setCurrentIndex(min(current_index, tab_widget.count() - 1))
+            else:
+                tab_widget.setCurrentWidget(current_widget)
+        finally:
+            tab_widget.blockSignals(False)
+        
+        for widget in created:
+            if isinstance(widget, BrowserTab):
+                self.connect_tab_signals(widget, tab_widget.indexOf(widget))
+        
+        # Lazy loading, hibernation and lifecycle only need to hear about a real switch
+        if tab_widget.currentWidget() is not current_widget:
+            tab_widget.currentChanged.emit(tab_widget.currentIndex())
+        
+        elapsed_ms = (time.monotonic() - start) * 1000
+        kept = len(widgets) - len(created)
+        log.info("🔄 Reconciled tabs of set '%s' in %.1f ms: %s kept (%s moved), %s added, %s removed",
+                 tab_set.name, elapsed_ms, kept, moved, len(created), len(removed))
+    
+    def add_tab_with_url(self, title, url, lazy=False, tab_config=None, tab_set=None):
+        tab_set = tab_set or self.tab_set
+        if lazy:
+            # Placeholder only - no QWebEngineView, renderer or network load yet
+            placeholder = LazyTabPlaceholder(title, url, tab_config)
+            tab_set.tab_widget.addTab(placeholder, title)
+            tab_set.tab_labels.set_title(placeholder, title)
+            tab_set.tab_search.set_entry(placeholder, title, url)
+            return
+        
+        tab = self.create_browser_tab(url, tab_config, tab_set)
+        # A saved snapshot, if any, is shown until the live page has loaded
+        widget = self.stale_first(tab, tab_set) or tab
+        index = tab_set.tab_widget.addTab(widget, title)
+        
+        # Label with keyboard shortcut indicator for first 10 tabs, set on the next flush
+        tab_set.tab_labels.set_title(widget, title)
+        tab_set.tab_search.set_entry(widget, title, url)
+        
+        self.connect_tab_signals(tab, index)
+    
+    def reload_persistent_config(self, path=None):
+        """Merge multibrowser.json changes made by another process into self.config"""
+        # Atomic renames replace the inode, which drops it from the watcher
+        if os.path.exists(DEFAULT_CONFIG_FILE) and DEFAULT_CONFIG_FILE not in self.config_watcher.files():
+            self.config_watcher.addPath(DEFAULT_CONFIG_FILE)
+        config_store.reload()
+    
+    def create_browser_tab(self, url, tab_config=None, tab_set=None):
+        """Create a BrowserTab for the given URL and its tabs.json entry in a tab set (default: the visible one)"""
+        tab_set = tab_set or self.tab_set
+        
+        # A saved session replaces the initial load with the saved history
+        entry = tab_set.session.take(url) if tab_set.session else None
+        
+        # Use the set's persistent profile for all its tabs
+        with startup_tracer.phase('BrowserTab.__init__', url=url):
+            tab = BrowserTab(None if entry else url, profile=tab_set.profile, popups=tab_set.popups,
+                             tier_settings=self.tab_tier_settings(tab_config or {}))
+        tab.tab_config = tab_config or {}
+        tab.tab_set = tab_set
+        tab.session_key = url
+        
+        if entry:
+            SessionStore.restore(tab, entry)
+            log.debug("⏪ Restored session history for %s", url)
+        return tab
+    
+    def tab_tier_settings(self, tab_config):
+        """Return the web settings bundle for a tabs.json entry ("tier" plus "settings" overrides)"""
+        tier = tab_config.get('tier', self.config.get('default_tier', DEFAULT_TIER))
+        if not isinstance(tier, str):
+            log.warning("⚠️  Invalid performance tier %r, using %s", tier, DEFAULT_TIER)
+            tier = DEFAULT_TIER
+        
+        # The overrides are part of the lru_cache key, so only hashable booleans may get through
+        overrides = tab_config.get('settings') or {}
+        if not isinstance(overrides, dict):
+            log.warning("⚠️  Ignoring \"settings\" of %s: expected an object of name: true/false", tab_config.get('url'))
+            overrides = {}
+        valid = {}
+        for name, enabled in overrides.items():
+            if isinstance(enabled, (bool, int, float)):
+                valid[name] = bool(enabled)
+            else:
+                log.warning("⚠️  Ignoring web setting '%s' of %s: %r is not true or false", name, tab_config.get('url'), enabled)
+        return resolve_tier_settings(tier, tuple(sorted(valid.items())))
+    
+    def connect_tab_signals(self, tab, index):
+        """Connect the title, URL and zoom signals of a tab"""
+        startup_tracer.watch_tab(tab, index)
+        
+        # URL and title changes only mark the label dirty - chatty pages (unread
+        # counters) change them many times per second, the label model flushes once
+        tab_labels = tab.tab_set.tab_labels
+        tab.urlChanged.connect(lambda url, t=tab: tab_labels.mark_dirty(t))
+        tab.titleChanged.connect(lambda title, t=tab: tab_labels.mark_dirty(t))
+        
+        # Live page titles are searchable in the tab switcher
+        tab_search = tab.tab_set.tab_search
+        tab.titleChanged.connect(lambda title, t=tab: tab_search.set_live_title(t, title))
+        
+        # A new page makes the overview thumbnail outdated
+        tab.loadFinished.connect(lambda ok, t=tab: self.thumbnails.invalidate(t))
+        
+        # Apply the stored zoom once per navigation - the page keeps it across loads
+        tab.urlChanged.connect(lambda url, t=tab: self.apply_zoom(t, url))
+        self.apply_zoom(tab)
+    
+    def ensure_tab_loaded(self, index):
+        """Replace a lazy placeholder with a real BrowserTab and start loading its URL"""
+        placeholder = self.tab_widget.widget(index)
+        if not isinstance(placeholder, LazyTabPlaceholder):
+            return placeholder
+        
+        tab = self.create_browser_tab(placeholder.pending_url, placeholder.tab_config)
+        self.replace_tab_widget(index, self.stale_first(tab, self.tab_set) or tab)
+        self.connect_tab_signals(tab, index)
+        log.debug("⚡ Loaded lazy tab %s: %s", index + 1, placeholder.pending_url)
+        return tab
+    
+    def stale_first(self, tab, tab_set):
+        """Return a view of the tab's saved snapshot that gives way to the live tab on loadFinished, or None"""
+        found = tab_set.snapshots.lookup(tab.session_key) if tab_set.snapshots else None
+        if not found:
+            return None
+        path, saved_at = found
+        view = SnapshotView(path, saved_at, tab)
+        view.view.loadFinished.connect(
+            lambda ok: startup_tracer.event('snapshotShown', tab=tab_set.tab_widget.indexOf(view), url=tab.session_key))
+        
+        def show_live(ok):
+            tab.loadFinished.disconnect(show_live)
+            index = tab_set.tab_widget.indexOf(view)
+            if index < 0:
+                # The tab was removed by a tabs.json reload while loading
+                tab.deleteLater()
+                return
+            self.replace_tab_widget(index, tab, tab_set)
+            log.debug("📸 Replaced snapshot of tab %s with the live page", index + 1)
+            # Hibernation and lifecycle only saw the snapshot being selected
+            if tab_set is self.tab_set and tab_set.tab_widget.currentIndex() == index:
+                self.current_tab_changed.emit(index)
+        tab.loadFinished.connect(show_live)
+        return view
+    
+    def save_snapshots(self):
+        """Snapshot every loaded, active configured tab (frozen and discarded tabs keep their last snapshot)"""
+        for tab_set in self.tab_sets.values():
+            if tab_set.snapshots:
+                for tab in self.browser_tabs(tab_set, popups=False):
+                    tab_set.snapshots.save(tab)
+    
+    def save_session(self):
+        """Write the navigation history and scroll position of every loaded tab, per tab set"""
+        for tab_set in self.tab_sets.values():
+            # Popup tabs have no tabs.json entry to restore them into
+            entries = [SessionStore.capture(tab, tab.session_key)
+                       for tab in self.browser_tabs(tab_set, popups=False)]
+            keys = {tab_config.get('url', 'about:blank') for tab_config in tab_set.tabs_config}
+            tab_set.session.save(entries, keys)
+    
+    def browser_tabs(self, tab_set=None, popups=True):
+        """Return all tabs that have a real BrowserTab (not lazy placeholders), in one or all tab sets
+        
+        With popups=False only configured tabs are returned, without popups opened as tabs.
+        """
+        tab_sets = [tab_set] if tab_set else self.tab_sets.values()
+        tabs = []
+        for each_set in tab_sets:
+            for i in range(each_set.tab_widget.count()):
+                widget = each_set.tab_widget.widget(i)
+                if isinstance(widget, BrowserTab) and (popups or not widget.popup):
+                    tabs.append(widget)
+        return tabs
+    
+    def switch_tab_set(self, name):
+        """Show another tab set; the views of both stay in this engine, warm or lazy"""
+        tab_set = self.tab_sets.get(name)
+        if tab_set is None:
+            log.warning("⚠️  Unknown tab set '%s'", name)
+            return
+        if tab_set is self.tab_set:
+            return
+        
+        start = time.monotonic()
+        self.thumbnails.capture(self.tab_widget.currentWidget())
+        self.tab_set = tab_set
+        self.tab_stack.setCurrentWidget(tab_set.tab_widget)
+        # To lazy loading, hibernation and lifecycle this is a switch to the set's current tab
+        self.current_tab_changed.emit(tab_set.tab_widget.currentIndex())
+        log.info("🗂️  Switched to tab set '%s' in %.1f ms", name, (time.monotonic() - start) * 1000)
+    
+    def forget_tab(self, widget):
+        """Drop a removed page widget from the thumbnail cache and every scheduler"""
+        self.thumbnails.invalidate(widget)
+        # The first lazy tab is loaded before the schedulers exist; prewarming tracks
+        # tabs by their tabs.json URL, so there is nothing to drop there
+        for name in ('reloads', 'hibernation', 'lifecycle'):
+            scheduler = getattr(self, name, None)
+            if scheduler:
+                scheduler.forget(widget)
+    
+    def replace_tab_widget(self, index, widget, tab_set=None):
+        """Swap the page widget of a tab while keeping its text and position"""
+        tab_set = tab_set or self.tab_set
+        tab_widget = tab_set.tab_widget
+        old_widget = tab_widget.widget(index)
+        text = tab_widget.tabText(index)
+        was_current = tab_widget.currentIndex() == index
+        
+        # Removing and re-inserting must not look like a tab switch to the rest of the app
+        tab_widget.blockSignals(True)
+        try:
+            tab_widget.removeTab(index)
+            tab_widget.insertTab(index, widget, text)
+            if was_current:
+                tab_widget.setCurrentIndex(index)
+        finally:
+            tab_widget.blockSignals(False)
+        
+        tab_set.tab_labels.replace(old_widget, widget)
+        tab_set.tab_search.replace(old_widget, widget)
+        self.forget_tab(old_widget)
+        old_widget.deleteLater()
     
     def setup_keyboard_shortcuts(self):
         """Set up keyboard shortcuts using QShortcut"""
@@ -554,28 +3651,38 @@ class MultiBrowser(QMainWindow):
                 shortcut_text = f"Alt+{i+1}"
             
             # Create shortcut
-            shortcut = QShortcut(QKeySequence(f"Alt+{i+1}"), self)
+            shortcut = QShortcut(QKeySequence(shortcut_text), self)
             shortcut.activated.connect(lambda tab_index=i: self.switch_to_tab(tab_index))
             
-            print(f"✓ Keyboard shortcut {shortcut_text} registered for tab {i+1}")
+            log.debug("✓ Keyboard shortcut %s registered for tab %s", shortcut_text, i+1)
         
         # Alt+Left for previous tab (with cycling)
         shortcut_left = QShortcut(QKeySequence("Alt+Left"), self)
         shortcut_left.activated.connect(self.previous_tab)
-        print("✓ Keyboard shortcut Alt+Left registered for previous tab")
+        log.debug("✓ Keyboard shortcut Alt+Left registered for previous tab")
         
         # Alt+Right for next tab (with cycling)
         shortcut_right = QShortcut(QKeySequence("Alt+Right"), self)
         shortcut_right.activated.connect(self.next_tab)
-        print("✓ Keyboard shortcut Alt+Right registered for next tab")
+        log.debug("✓ Keyboard shortcut Alt+Right registered for next tab")
         
         # F5 for refresh current tab
         shortcut_refresh = QShortcut(QKeySequence("F5"), self)
         shortcut_refresh.activated.connect(self.refresh_current_tab)
-        print("✓ Keyboard shortcut F5 registered for refresh")
+        log.debug("✓ Keyboard shortcut F5 registered for refresh")
+        
+        # Alt+O for the tab overview
+        shortcut_overview = QShortcut(QKeySequence("Alt+O"), self)
+        shortcut_overview.activated.connect(self.show_tab_overview)
+        log.debug("✓ Keyboard shortcut Alt+O registered for tab overview")
+        
+        # Alt+P for the tab switcher (reaches every tab, not only the first 10)
+        shortcut_switcher = QShortcut(QKeySequence("Alt+P"), self)
+        shortcut_switcher.activated.connect(self.show_tab_switcher)
+        log.debug("✓ Keyboard shortcut Alt+P registered for tab switcher")
     
-    def setup_hamburger_menu(self):
-        """Set up hamburger menu with options"""
+    def setup_hamburger_menu(self, tab_set):
+        """Set up hamburger menu with options on a tab set's tab bar"""
         # Create hamburger button
         menu_button = QToolButton()
         menu_button.setText("☰")  # Hamburger icon
@@ -588,6 +3695,44 @@ class MultiBrowser(QMainWindow):
         clear_cookies_action.triggered.connect(self.clear_cookies_and_reload)
         menu.addAction(clear_cookies_action)
         
+        # Add "Switch Tab" action
+        tab_switcher_action = QAction("Switch Tab", menu_button)
+        tab_switcher_action.triggered.connect(self.show_tab_switcher)
+        menu.addAction(tab_switcher_action)
+        
+        # Add "Tab Overview" action
+        tab_overview_action = QAction("Tab Overview", menu_button)
+        tab_overview_action.triggered.connect(self.show_tab_overview)
+        menu.addAction(tab_overview_action)
+        
+        # Add "Task Manager" action
+        task_manager_action = QAction("Task Manager", menu_button)
+        task_manager_action.triggered.connect(self.show_task_manager)
+        menu.addAction(task_manager_action)
+        
+        # Add "Log" action
+        log_action = QAction("Log", menu_button)
+        log_action.triggered.connect(self.show_log)
+        menu.addAction(log_action)
+        
+        # Add "HTTP Cache" action
+        http_cache_action = QAction("HTTP Cache", menu_button)
+        http_cache_action.triggered.connect(self.show_http_cache)
+        menu.addAction(http_cache_action)
+        
+        # Add a "Tab Sets" submenu when there is more than one set
+        if len(self.tab_sets) > 1:
+            tab_sets_menu = menu.addMenu("Tab Sets")
+            # Exclusive, so clicking the current set keeps it checked
+            tab_sets_group = QActionGroup(menu_button)
+            for name in self.tab_sets:
+                tab_set_action = QAction(name, menu_button)
+                tab_set_action.setCheckable(True)
+                tab_sets_group.addAction(tab_set_action)
+                tab_set_action.setChecked(name == tab_set.name)
+                tab_set_action.triggered.connect(lambda checked, n=name: self.switch_tab_set(n))
+                tab_sets_menu.addAction(tab_set_action)
+        
         # Add separator
         menu.addSeparator()
         
@@ -596,47 +3741,157 @@ class MultiBrowser(QMainWindow):
         close_action.triggered.connect(self.close)
         menu.addAction(close_action)
         
+        # "Close" only hides a single-instance window, so offer a real quit as well
+        if self.single_instance:
+            quit_action = QAction("Quit", menu_button)
+            quit_action.triggered.connect(self.quit_application)
+            menu.addAction(quit_action)
+        
         # Set menu on button
         menu_button.setMenu(menu)
         menu_button.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
         
         # Add to tab bar corner widget
-        self.tab_widget.setCornerWidget(menu_button, Qt.Corner.TopRightCorner)
+        tab_set.tab_widget.setCornerWidget(menu_button, Qt.Corner.TopRightCorner)
         
-        print("✓ Hamburger menu set up with Clear Cookies and Close options")
+        log.debug("✓ Hamburger menu set up with Clear Cookies, Switch Tab, Tab Overview, Task Manager, Log, HTTP Cache and Close options")
+    
+    def show_tab_switcher(self):
+        """Show the tab search palette"""
+        dialog = TabSwitcherDialog(self, self)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.show()
+    
+    def show_tab_overview(self):
+        """Show thumbnails of the visible tab set's tabs"""
+        # The current tab is visible, so its thumbnail can be refreshed for free
+        self.thumbnails.capture(self.tab_widget.currentWidget())
+        dialog = TabOverviewDialog(self, self)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.show()
+    
+    def show_task_manager(self):
+        """Show per-tab resource usage"""
+        dialog = TaskManagerDialog(self.telemetry, self)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.show()
+    
+    def show_log(self):
+        """Show recent log records"""
+        dialog = LogViewerDialog(self)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.show()
+    
+    def show_http_cache(self):
+        """Show per-origin HTTP cache usage"""
+        dialog = HttpCacheDialog(self.http_cache, self)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.show()
+    
+    def closeEvent(self, event):
+        """Hide instead of closing in single-instance mode"""
+        if self.single_instance and not self.quitting:
+            event.ignore()
+            self.hide()
+            log.info("💤 Window hidden, engine kept warm for the next launch")
+            return
+        super().closeEvent(event)
+    
+    def quit_application(self):
+        """Quit even in single-instance mode"""
+        self.quitting = True
+        QApplication.quit()
+    
+    def handle_remote_args(self, argv, cwd=None):
+        """Handle the arguments of a later launch: show, raise or re-target the window"""
+        try:
+            args = build_arg_parser().parse_args(argv)
+        except SystemExit:
+            log.warning("⚠️  Ignoring invalid arguments from second launch: %s", argv)
+            return
+        
+        if args.quit:
+            self.quit_application()
+            return
+        
+        # A stats request must not pop the window up
+        if args.dump_stats:
+            # Relative paths are relative to where the second launch ran
+            path = os.path.join(cwd or os.getcwd(), args.dump_stats)
+            self.telemetry.sample()
+            self.telemetry.dump(path)
+            log.info("📊 Stats written to %s", path)
+            return
+        
+        if args.theme:
+            self.apply_theme(args.theme)
+        
+        if args.tab_set:
+            self.switch_tab_set(args.tab_set)
+        
+        if args.tab is not None:
+            self.switch_to_tab(args.tab - 1)
+        
+        if self.isMinimized():
+            self.showNormal()
+        else:
+            self.show()
+        self.raise_()
+        self.activateWindow()
+        log.debug("✓ Window shown for second launch")
+    
+    def activate_tab(self, index):
+        """Switch to a tab on behalf of the user, recording the switch for prewarming and the overview"""
+        if self.prewarm:
+            self.prewarm.record_switch(index)
+        # Capture the tab being left while it is still on screen
+        if index != self.tab_widget.currentIndex():
+            self.thumbnails.capture(self.tab_widget.currentWidget())
+        self.tab_widget.setCurrentIndex(index)
+    
+    def switch_to_widget(self, tab_set, widget):
+        """Jump straight to a tab of any set without selecting anything in between"""
+        index = tab_set.tab_widget.indexOf(widget)
+        if index < 0:
+            return
+        if tab_set is not self.tab_set:
+            # A background set's switches are not forwarded, so its previous current tab stays untouched
+            tab_set.tab_widget.setCurrentIndex(index)
+            self.switch_tab_set(tab_set.name)
+        self.activate_tab(index)
     
     def switch_to_tab(self, tab_index):
         """Switch to the specified tab"""
         if 0 <= tab_index < self.tab_widget.count():
-            self.tab_widget.setCurrentIndex(tab_index)
-            print(f"✓ Switched to tab {tab_index + 1} via keyboard shortcut")
+            self.activate_tab(tab_index)
+            log.debug("✓ Switched to tab %s via keyboard shortcut", tab_index + 1)
     
     def previous_tab(self):
         """Switch to previous tab with cycling"""
         current_index = self.tab_widget.currentIndex()
         new_index = (current_index - 1) % self.tab_widget.count()
-        self.tab_widget.setCurrentIndex(new_index)
-        print(f"✓ Switched to previous tab {new_index + 1} (with cycling)")
+        self.activate_tab(new_index)
+        log.debug("✓ Switched to previous tab %s (with cycling)", new_index + 1)
     
     def next_tab(self):
         """Switch to next tab with cycling"""
         current_index = self.tab_widget.currentIndex()
         new_index = (current_index + 1) % self.tab_widget.count()
-        self.tab_widget.setCurrentIndex(new_index)
-        print(f"✓ Switched to next tab {new_index + 1} (with cycling)")
+        self.activate_tab(new_index)
+        log.debug("✓ Switched to next tab %s (with cycling)", new_index + 1)
     
     def refresh_current_tab(self):
         """Refresh the current tab"""
         current_widget = self.tab_widget.currentWidget()
-        if hasattr(current_widget, 'reload'):
-            current_widget.reload()
-            print("✓ Current tab refreshed")
+        if isinstance(current_widget, BrowserTab):
+            self.reloads.reload([current_widget])
+            log.debug("✓ Current tab refreshed")
         else:
-            print("⚠️  Current widget doesn't support refresh")
+            log.warning("⚠️  Current widget doesn't support refresh")
     
     def clear_cookies_and_reload(self):
         """Clear cookies and reload all tabs"""
-        print("🔒 Clearing cookies and session data...")
+        log.info("🔒 Clearing cookies and session data...")
         
         # Clear cookies
         self.profile.cookieStore().deleteAllCookies()
@@ -644,76 +3899,24 @@ class MultiBrowser(QMainWindow):
         # Clear HTTP cache
         self.profile.clearHttpCache()
         
-        print("🔄 Reloading all tabs...")
+        log.info("🔄 Reloading all tabs...")
         
-        # Reload all tabs
-        for i in range(self.tab_widget.count()):
-            widget = self.tab_widget.widget(i)
-            if hasattr(widget, 'reload'):
-                widget.reload()
-                print(f"✓ Reloaded tab {i+1}")
-        
-        print("🎉 Cookies cleared and all tabs reloaded - ready for new session!")
-    
-    def update_tab_title(self, index, url):
-        if index >= 0 and index < self.tab_widget.count():
-            # Use the title from config for initial setup
-            if index < len(self.tabs_config):
-                tab_text = self.tabs_config[index].get('title', url.toString())
-            else:
-                tab_text = url.toString()
-            
-            # Truncate if too long
-            if len(tab_text) > 25:  # Reduced to make room for shortcut
-                tab_text = tab_text[:22] + "..."
-            
-            # Re-add shortcut indicator if it's one of the first 10 tabs
-            if index < 10:
-                tab_text = f"(Alt+{index + 1}) {tab_text}"
-            
-            self.tab_widget.setTabText(index, tab_text)
-    
-    def restore_tab_zoom_after_load(self, index):
-        """Restore zoom factor for the tab after page load completes"""
-        if index >= 0 and index < self.tab_widget.count():
-            # Get the tab URL as a unique identifier
-            tab_widget = self.tab_widget.widget(index)
-            if hasattr(tab_widget, 'url'):
-                tab_url = tab_widget.url().toString()
-                
-                # Get saved zoom factor for this URL
-                zoom_factors = self.config.get('zoom_factors', {})
-                saved_zoom = zoom_factors.get(tab_url)
-                
-                if saved_zoom is not None and hasattr(tab_widget, 'setZoomFactor'):
-                    tab_widget.setZoomFactor(saved_zoom)
-                    print(f"🔍 Restored zoom factor {saved_zoom} for tab after load: {tab_url}")
-                else:
-                    # If no saved zoom, set default zoom factor
-                    if hasattr(tab_widget, 'setZoomFactor'):
-                        tab_widget.setZoomFactor(1.0)
-                        print(f"🔍 Set default zoom factor 1.0 for tab after load: {tab_url}")
-
-    def restore_tab_zoom(self, index):
-        """Restore zoom factor for the current tab"""
-        if index >= 0 and index < self.tab_widget.count():
-            # Get the tab URL as a unique identifier
-            tab_widget = self.tab_widget.widget(index)
-            if hasattr(tab_widget, 'url'):
-                tab_url = tab_widget.url().toString()
-                
-                # Get saved zoom factor for this URL
-                zoom_factors = self.config.get('zoom_factors', {})
-                saved_zoom = zoom_factors.get(tab_url)
-                
-                if saved_zoom is not None and hasattr(tab_widget, 'setZoomFactor'):
-                    tab_widget.setZoomFactor(saved_zoom)
-                    print(f"🔍 Restored zoom factor {saved_zoom} for tab: {tab_url}")
-                else:
-                    # If no saved zoom, set default zoom factor
-                    if hasattr(tab_widget, 'setZoomFactor'):
-                        tab_widget.setZoomFactor(1.0)
-                        print(f"🔍 Set default zoom factor 1.0 for tab: {tab_url}")
+        # Visible tab first, the rest staggered (lazy placeholders load fresh anyway)
+        self.reloads.reload(self.browser_tabs(self.tab_set))
+        
+        log.info("🎉 Cookies cleared and tab reloads scheduled - ready for new session!")
+    
+    def apply_zoom(self, tab, url=None):
+        """Apply the indexed zoom for the tab's URL, skipping redundant setZoomFactor calls"""
+        url = url or tab.url()
+        key, zoom = self.zoom_index.lookup(url.toString())
+        if key is None:
+            return
+        
+        zoom = zoom if zoom is not None else 1.0
+        if abs(tab.zoomFactor() - zoom) > 0.001:
+            tab.setZoomFactor(zoom)
+            log.debug("🔍 Applied zoom factor %s for %s", zoom, key)
     
     def save_current_tab_zoom(self):
         """Save zoom factor for the current tab"""
@@ -721,16 +3924,14 @@ class MultiBrowser(QMainWindow):
         if current_index >= 0:
             tab_widget = self.tab_widget.widget(current_index)
             if hasattr(tab_widget, 'url') and hasattr(tab_widget, 'zoomFactor'):
-                tab_url = tab_widget.url().toString()
                 current_zoom = tab_widget.zoomFactor()
                 
-                # Update config
-                if 'zoom_factors' not in self.config:
-                    self.config['zoom_factors'] = {}
-                
-                self.config['zoom_factors'][tab_url] = current_zoom
+                # Update config through the zoom index (keyed by origin or path rule)
+                key = self.zoom_index.set(tab_widget.url().toString(), current_zoom)
+                if key is None:
+                    return
                 save_config(self.config)
-                print(f"💾 Saved zoom factor {current_zoom} for tab: {tab_url}")
+                log.debug("💾 Saved zoom factor %.2f for %s", current_zoom, key)
     
     def keyPressEvent(self, event):
         # Handle Alt+n keyboard shortcuts for tab switching (first 10 tabs)
@@ -745,7 +3946,7 @@ class MultiBrowser(QMainWindow):
                 
                 # Switch to the corresponding tab if it exists
                 if 0 <= tab_index < self.tab_widget.count():
-                    self.tab_widget.setCurrentIndex(tab_index)
+                    self.activate_tab(tab_index)
                     event.accept()
                     return
         
@@ -778,24 +3979,99 @@ class MultiBrowser(QMainWindow):
             current_widget.setZoomFactor(1.0)
             self.save_current_tab_zoom()
 
-def main():
+def build_arg_parser():
+    """Build the command line parser (also used for arguments handed over by later launches)"""
     parser = argparse.ArgumentParser(description='MultiBrowser - Tabbed Web Browser')
     parser.add_argument('--config', default='tabs.json', help='Path to JSON config file with tabs')
     parser.add_argument('--window-class', help='Window class for window manager identification')
-    parser.add_argument('--theme', choices=['dark', 'tokyo-night'], 
-                       help='Theme for the browser (dark, tokyo-night)')
+    parser.add_argument('--theme', choices=list_themes(), 
+                       help=f"Theme for the browser ({', '.join(list_themes())})")
     parser.add_argument('--dark-mode', action='store_true', 
                        help='Enable dark mode (default is enabled)')
     parser.add_argument('--light-mode', action='store_true', 
                        help='Disable dark mode (enable light mode)')
-    
+    parser.add_argument('--lazy-tabs', action='store_true', default=None,
+                       help='Only create a tab\'s web view when it is first activated')
+    parser.add_argument('--restore-session', action='store_true', default=None,
+                       help='Restore each tab\'s navigation history and scroll position from the last run')
+    parser.add_argument('--single-instance', action='store_true', default=None,
+                       help='Hand arguments to an already running instance with the same window class and config')
+    parser.add_argument('--tab-set', metavar='NAME',
+                       help='Show this tab set (from "tab_sets" in multibrowser.json) on startup or in the running instance')
+    parser.add_argument('--tab', type=int,
+                       help='Switch to this tab (1-based) on startup or in the running instance')
+    parser.add_argument('--quit', action='store_true',
+                       help='Quit the running single-instance browser')
+    parser.add_argument('--engine-preset', choices=sorted(ENGINE_PRESETS),
+                       help='Chromium engine preset (overrides "engine.preset" in multibrowser.json)')
+    parser.add_argument('--renderer-process-limit', type=int,
+                       help='Maximum number of Chromium renderer processes (0 = Chromium default)')
+    parser.add_argument('--process-model', choices=ENGINE_PROCESS_MODELS,
+                       help='Chromium process model')
+    parser.add_argument('--print-engine-config', action='store_true',
+                       help='Print the effective engine settings and Chromium flags, then exit')
+    parser.add_argument('--dump-stats', metavar='PATH',
+                       help='Write per-tab renderer PID, RSS, PSS and CPU usage as JSON to PATH (refreshed every sample)')
+    parser.add_argument('--trace-startup', metavar='PATH',
+                       help='Record startup phase and tab load timestamps and write them as JSON to PATH')
+    parser.add_argument('--trace-format', choices=['json', 'chrome'], default='json',
+                       help='Format of the startup trace (plain JSON or Chrome trace-event format)')
+    parser.add_argument('--trace-timeout', type=float, default=30.0,
+                       help='Also write the startup trace after this many seconds (0 = only on exit)')
+    parser.add_argument('--log-level', type=str.upper, choices=LOG_LEVELS,
+                       help='Console log level (overrides "logging.level" in multibrowser.json, default WARNING)')
+    return parser
+
+
+def main():
+    parser = build_arg_parser()
     args = parser.parse_args()
     
+    if args.trace_startup:
+        startup_tracer.enable(args.trace_startup, args.trace_format)
+    
+    # Log to the console at --log-level until the config says otherwise
+    setup_logging(level=args.log_level)
+    
+    # Load persistent configuration
+    with startup_tracer.phase('load_config'):
+        config = load_config()
+    setup_logging(config.get('logging'), level=args.log_level)
+    
+    single_instance = args.single_instance
+    if single_instance is None:
+        single_instance = config.get('single_instance', DEFAULT_SINGLE_INSTANCE)
+    
+    # Hand over to a running instance before paying for QApplication and Chromium
+    if single_instance and not args.print_engine_config:
+        if forward_to_running_instance(sys.argv[1:]):
+            print("✓ Handed over to running MultiBrowser instance")
+            return
+        if args.quit:
+            print("No running MultiBrowser instance to quit")
+            return
+    
+    # Chromium flags are read once when the engine starts, so apply them before QApplication
+    engine_settings, engine_warnings = resolve_engine_config(config, args)
+    for warning in engine_warnings:
+        log.warning("⚠️  Engine config: %s", warning)
+    
+    if args.print_engine_config:
+        print(json.dumps({
+            'settings': engine_settings,
+            'chromium_flags': build_chromium_flags(engine_settings),
+            'warnings': engine_warnings
+        }, indent=2))
+        return
+    
+    apply_engine_config(engine_settings)
+    
     # Enable high DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
     
-    app = QApplication(sys.argv)
+    with startup_tracer.phase('QApplication'):
+        app = QApplication(sys.argv)
     
     # Set application attributes for better compatibility
     app.setApplicationName("MultiBrowser")
@@ -808,9 +4084,6 @@ def main():
         # For X11 window managers
         app.setDesktopFileName(args.window_class)
     
-    # Load persistent configuration
-    config = load_config()
-    
     # Handle dark/light mode flags
     if args.light_mode:
         dark_mode = False
@@ -826,18 +4099,50 @@ def main():
     # Determine effective theme - use command line theme if provided, otherwise use config
     effective_theme = args.theme if args.theme else config.get('theme', DEFAULT_THEME)
     
-    print(f"🌓 Starting MultiBrowser with theme: {effective_theme}, dark_mode: {dark_mode}")
+    log.info("🌓 Starting MultiBrowser with theme: %s, dark_mode: %s", effective_theme, dark_mode)
+    
+    with startup_tracer.phase('MultiBrowser.__init__'):
+        browser = MultiBrowser(
+            config_file=args.config, 
+            window_class=args.window_class, 
+            theme=effective_theme,
+            dark_mode=dark_mode,
+            config=config,
+            lazy_tabs=args.lazy_tabs,
+            single_instance=single_instance,
+            restore_session=args.restore_session,
+            tab_set=args.tab_set
+        )
+    
+    if args.tab is not None:
+        browser.switch_to_tab(args.tab - 1)
+    
+    if args.dump_stats:
+        browser.telemetry.dump_path = args.dump_stats
+    
+    server = None
+    if single_instance:
+        # A hidden window must not end the process - the next launch shows it again
+        app.setQuitOnLastWindowClosed(False)
+        socket_path = instance_socket_path(args.window_class, args.config)
+        server = SingleInstanceServer(socket_path, browser.handle_remote_args, app)
+    
+    with startup_tracer.phase('show'):
+        browser.show()
+    
+    # Never lose a debounced config write
+    app.aboutToQuit.connect(config_store.flush)
     
-    browser = MultiBrowser(
-        config_file=args.config, 
-        window_class=args.window_class, 
-        theme=effective_theme,
-        dark_mode=dark_mode,
-        config=config
-    )
-    browser.show()
+    if startup_tracer.enabled:
+        app.aboutToQuit.connect(startup_tracer.write)
+        if args.trace_timeout > 0:
+            QTimer.singleShot(int(args.trace_timeout * 1000), startup_tracer.write)
+        QTimer.singleShot(0, lambda: startup_tracer.event('event_loop_started'))
     
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    if server:
+        server.close()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Single-instance handoff for MultiBrowser
+
+This module deliberately only uses the standard library: a second launch can
+hand its arguments to the running browser and exit in milliseconds, without
+importing PyQt6 or starting a Chromium engine.
+"""
+
+import sys
+import os
+import json
+import socket
+import hashlib
+import argparse
+import tempfile
+
+CONNECT_TIMEOUT = 0.5  # seconds to wait for a running instance to answer
+
+
+def parse_instance_args(argv):
+    """Extract the arguments that identify an instance (--window-class and --config)"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--config', default='tabs.json')
+    parser.add_argument('--window-class')
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def instance_socket_path(window_class, config_file):
+    """Return the local socket path for a (window class, tabs config) pair"""
+    key = f"{window_class or ''}\0{os.path.abspath(config_file)}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"multibrowser-{digest}.sock")
+
+
+def forward_to_running_instance(argv):
+    """Send argv to a running instance, return True if it accepted them"""
+    args = parse_instance_args(argv)
+    socket_path = instance_socket_path(args.window_class, args.config)
+    if not os.path.exists(socket_path):
+        return False
+
+    message = json.dumps({'argv': argv, 'cwd': os.getcwd()}) + "\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(socket_path)
+            sock.sendall(message.encode('utf-8'))
+            reply = sock.makefile('r').readline()
+    except OSError:
+        # Stale socket from a crashed instance or no answer in time
+        return False
+
+    return reply.strip() == "ok"
+
+
+if __name__ == "__main__":
+    # Exit code 0 means a running instance took over, 1 means start a new one
+    sys.exit(0 if forward_to_running_instance(sys.argv[1:]) else 1)
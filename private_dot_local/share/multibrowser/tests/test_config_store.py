@@ -0,0 +1,71 @@
+"""Two MultiBrowser processes sharing multibrowser.json must not undo each other's changes"""
+
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWebEngineWidgets")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+def open_store(path):
+    # A long delay keeps the worker waiting, the test flushes explicitly
+    store = main.ConfigStore(str(path), write_delay=60)
+    store.load()
+    return store
+
+
+def test_flush_before_reload_keeps_other_instance_change(tmp_path):
+    path = tmp_path / "multibrowser.json"
+    path.write_text(json.dumps({'theme': 'light', 'dark_mode': True, 'zoom_factors': {}}))
+    a = open_store(path)
+    b = open_store(path)
+
+    b.data['theme'] = 'dark'
+    b.save(b.data)
+    b.flush()
+
+    # A writes its own change before its file watcher has picked up B's
+    a.data['zoom_factors']['https://mail.example.com'] = 1.5
+    a.save(a.data)
+    a.flush()
+
+    assert a.reload()
+    assert a.data['theme'] == 'dark'
+
+    a.data['dark_mode'] = False
+    a.save(a.data)
+    a.flush()
+
+    on_disk = json.loads(path.read_text())
+    assert on_disk == {
+        'theme': 'dark',
+        'dark_mode': False,
+        'zoom_factors': {'https://mail.example.com': 1.5}
+    }
+
+
+def test_flush_without_reload_keeps_other_instance_change(tmp_path):
+    path = tmp_path / "multibrowser.json"
+    path.write_text(json.dumps({'theme': 'light', 'dark_mode': True}))
+    a = open_store(path)
+    b = open_store(path)
+
+    b.data['theme'] = 'dark'
+    b.save(b.data)
+    b.flush()
+
+    # Two writes from A in a row, the watcher never ran in between
+    a.data['dark_mode'] = False
+    a.save(a.data)
+    a.flush()
+    a.data['dark_mode'] = True
+    a.save(a.data)
+    a.flush()
+
+    assert json.loads(path.read_text())['theme'] == 'dark'
@@ -0,0 +1,86 @@
+"""Lifecycle stats must survive tabs deleted between two freeze checks"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWebEngineWidgets")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from PyQt6 import sip  # noqa: E402
+from PyQt6.QtCore import QCoreApplication, QObject, QUrl  # noqa: E402
+from PyQt6.QtWebEngineCore import QWebEnginePage  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+class FakeSignal:
+    def connect(self, slot):
+        pass
+
+
+class FakePage:
+    lifecycleStateChanged = FakeSignal()
+
+    def lifecycleState(self):
+        return QWebEnginePage.LifecycleState.Active
+
+
+class FakeTab(QObject):
+    """Stands in for a BrowserTab; a real QObject so it can be deleted"""
+
+    def __init__(self, url):
+        super().__init__()
+        self._url = url
+        self._page = FakePage()
+
+    def page(self):
+        return self._page
+
+    def url(self):
+        return QUrl(self._url)
+
+
+class FakeBrowser(QObject):
+    def __init__(self, tabs):
+        super().__init__()
+        self.tabs = tabs
+
+    def browser_tabs(self, tab_set=None, popups=True):
+        return [tab for tab in self.tabs if not sip.isdeleted(tab)]
+
+
+def test_stats_after_tracked_tab_is_deleted(app):
+    kept = FakeTab("https://mail.example.com")
+    removed = FakeTab("https://chat.example.com")
+    scheduler = main.TabLifecycleScheduler(FakeBrowser([kept, removed]))
+    scheduler.register(kept)
+    scheduler.register(removed)
+    scheduler.current_tab = removed
+
+    sip.delete(removed)
+
+    assert [entry['url'] for entry in scheduler.stats()] == ["https://mail.example.com"]
+    assert scheduler.current_tab is None
+
+
+def test_stats_and_tick_skip_deleted_tab_without_destroyed_signal(app):
+    kept = FakeTab("https://mail.example.com")
+    removed = FakeTab("https://chat.example.com")
+    scheduler = main.TabLifecycleScheduler(FakeBrowser([kept, removed]))
+    scheduler.register(kept)
+    # Tracked without the destroyed hook, as if the signal had not been delivered yet
+    scheduler.state_stats[removed] = dict(scheduler.state_stats[kept])
+    scheduler.hidden_since[removed] = 0.0
+
+    sip.delete(removed)
+
+    assert [entry['url'] for entry in scheduler.stats()] == ["https://mail.example.com"]
+    scheduler.freeze_idle_tabs()
+    assert removed not in scheduler.hidden_since
@@ -0,0 +1,93 @@
+"""Snapshot saving must skip tabs without a tabs.json entry (popups)"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWebEngineWidgets")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from PyQt6.QtCore import QUrl  # noqa: E402
+from PyQt6.QtWebEngineCore import QWebEnginePage  # noqa: E402
+
+
+class FakeSignal:
+    def connect(self, slot):
+        pass
+
+
+class FakeProfile:
+    downloadRequested = FakeSignal()
+
+
+class FakePage:
+    def __init__(self):
+        self.saved = []
+
+    def lifecycleState(self):
+        return QWebEnginePage.LifecycleState.Active
+
+    def save(self, path, save_format):
+        self.saved.append(path)
+
+
+class FakeTab:
+    """Stands in for a BrowserTab; popups have no session_key"""
+
+    def __init__(self, url, session_key=None, popup=False):
+        self._url = url
+        self._page = FakePage()
+        self.popup = popup
+        if session_key is not None:
+            self.session_key = session_key
+
+    def page(self):
+        return self._page
+
+    def url(self):
+        return QUrl(self._url)
+
+
+def test_save_skips_tab_without_session_key(tmp_path):
+    store = main.SnapshotStore(FakeProfile(), str(tmp_path))
+    popup = FakeTab("https://accounts.example.com/login", popup=True)
+
+    store.save(popup)
+
+    assert popup.page().saved == []
+    assert store.pending == {}
+
+
+def test_save_writes_configured_tab_to_temporary_file(tmp_path):
+    store = main.SnapshotStore(FakeProfile(), str(tmp_path))
+    tab = FakeTab("https://mail.example.com/inbox", session_key="https://mail.example.com")
+
+    store.save(tab)
+
+    tmp_path_for_key = store.path("https://mail.example.com") + ".tmp"
+    assert tab.page().saved == [tmp_path_for_key]
+    assert store.pending == {tmp_path_for_key: store.path("https://mail.example.com")}
+
+
+def test_save_snapshots_with_popup_tab_open(tmp_path):
+    store = main.SnapshotStore(FakeProfile(), str(tmp_path))
+    configured = FakeTab("https://mail.example.com", session_key="https://mail.example.com")
+    popup = FakeTab("https://accounts.example.com/login", popup=True)
+
+    class FakeTabSet:
+        snapshots = store
+
+    class FakeBrowser:
+        tab_sets = {'default': FakeTabSet()}
+
+        def browser_tabs(self, tab_set=None, popups=True):
+            # Even if a popup slips through, the timer slot must not raise
+            return [configured, popup]
+
+    main.MultiBrowser.save_snapshots(FakeBrowser())
+
+    assert len(configured.page().saved) == 1
+    assert popup.page().saved == []
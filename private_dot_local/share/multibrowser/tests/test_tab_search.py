@@ -0,0 +1,53 @@
+"""The tab switcher must find tabs by a query that starts in the middle of a word"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWebEngineWidgets")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+class FakeTab:
+    def __init__(self, name):
+        self.name = name
+
+
+@pytest.fixture
+def index():
+    index = main.TabSearchIndex(None)
+    for title, url in [("GitHub", "https://github.com"),
+                       ("Gmail", "https://mail.google.com"),
+                       ("YouTube", "https://www.youtube.com"),
+                       ("Calendar", "https://calendar.google.com")]:
+        index.set_entry(FakeTab(title), title, url)
+    return index
+
+
+def titles(results):
+    return [widget.name for score, widget in sorted(results, key=lambda result: -result[0])]
+
+
+@pytest.mark.parametrize("query, title", [("hub", "GitHub"), ("ithu", "GitHub"), ("ail", "Gmail"),
+                                          ("ube", "YouTube"), ("endar", "Calendar")])
+def test_mid_word_query_matches(index, query, title):
+    assert titles(index.search(query))[0] == title
+
+
+def test_longer_query_keeps_short_query_match(index):
+    # Typing one more character must not lose the tab the shorter query found
+    assert "GitHub" in titles(index.search("ub"))
+    assert "GitHub" in titles(index.search("hub"))
+    assert "GitHub" in titles(index.search("thub"))
+
+
+def test_word_start_still_ranks_first(index):
+    assert titles(index.search("gma"))[0] == "Gmail"
+
+
+def test_subsequence_fallback(index):
+    assert titles(index.search("gthb")) == ["GitHub"]